@@ -1,15 +1,36 @@
 """Array factory method. Extending with PyArrow, and adding more typing.
 """
-from typing import Any, Iterable, Optional, TypeVar, overload
+import array as pyarray
+from typing import Any, Iterable, List, Optional, Sized, TypeVar, overload
 
+import numpy as np
 import pyarrow as pa
 
 from .base_extension_array import BaseExtensionArray
-from .extension_type_registry import find_registry_extension_type
+from .extension_type_registry import find_registry_extension_type_or_none
 from .utils import first_valid_item_in_iterable
 
 TItem = TypeVar("TItem")
 
+_numpy_fast_path_kinds = frozenset("biufmM")
+"""Numpy dtype kinds directly converted by PyArrow (i.e. without any Python item iteration).
+"""
+
+
+def _as_numpy_fast_path(obj: Any) -> Optional[np.ndarray]:
+    """Get a Numpy view of the input if it can be directly converted by PyArrow (zero-copy when possible).
+
+    Args:
+        obj: Any input object.
+    Returns:
+        Numpy 1d array if the fast path applies, None otherwise.
+    """
+    if isinstance(obj, (pyarray.array, memoryview)):
+        obj = np.asarray(obj)
+    if isinstance(obj, np.ndarray) and obj.ndim == 1 and obj.dtype.kind in _numpy_fast_path_kinds:
+        return obj
+    return None
+
 
 def array(obj: Iterable[Optional[TItem]], size: Optional[int] = None) -> BaseExtensionArray[TItem]:
     """Generic `array` factory method, extending PyArrow `array`.
@@ -20,34 +41,45 @@ def array(obj: Iterable[Optional[TItem]], size: Optional[int] = None) -> BaseExt
     Returns:
         Arrowbic array (or PyArrow array in the base type case).
     """
+    # Fast path: Numpy base arrays (and buffer protocol), no need to iterate over Python items.
+    np_obj = _as_numpy_fast_path(obj)
+    if np_obj is not None:
+        return pa.array(np_obj[:size] if size is not None else np_obj)
+    if hasattr(obj, "__arrow_array__"):
+        return pa.array(obj, size=size)
+
     consumed_size, first_item, obj = first_valid_item_in_iterable(obj)
     # No item which is not null.
     if first_item is None:
         size = min(size, consumed_size) if size is not None else consumed_size
         return pa.nulls(size)
 
-    item_pyclass = type(first_item)
-    try:
-        # Is the first item Python class in the Arrowbic registry?
-        root_ext_type = find_registry_extension_type(item_pyclass)
-        arr = root_ext_type.__arrowbic_from_item_iterator__(obj, size=size)
-        return arr
-    except KeyError:
+    # Size hint forwarded to the array builders, when the input is sized (sequences kept as is by the builders).
+    if size is None and isinstance(obj, Sized):
+        size = len(obj)
+
+    # Is the first item Python class in the Arrowbic registry?
+    root_ext_type = find_registry_extension_type_or_none(type(first_item))
+    if root_ext_type is None:
         # Default case: try to use PyArrow
-        arr = pa.array(obj, size=size)
-        return arr
+        return pa.array(obj, size=size)
+    return root_ext_type.__arrowbic_from_item_iterator__(obj, size=size)
+
+
+_asarray_noop_types = (pa.Array, pa.ChunkedArray)
 
 
 def asarray(obj: Iterable[Optional[TItem]], size: Optional[int] = None) -> BaseExtensionArray[TItem]:
     """Generic `asarray` factory method, converting to an array if not already the case.
 
     Args:
-        obj: Any iterable, compatible with PyArrow or Arrowbic. Or already PyArrow array.
+        obj: Any iterable, compatible with PyArrow or Arrowbic. Or already PyArrow (chunked) array.
         size: Optional size of the input iterable.
     Returns:
-        Arrowbic array (or PyArrow array in the base type case).
+        Arrowbic array (or PyArrow array in the base type case). PyArrow chunked arrays are returned as is.
     """
-    if isinstance(obj, pa.Array):
+    # Already Arrow arrays: no conversion (nor items peeking).
+    if isinstance(obj, _asarray_noop_types):
         return obj
     return array(obj, size=size)
 
@@ -74,8 +106,38 @@ def get_pyitem(arr: pa.Array, index: int) -> Optional[Any]:
         Item (or None if null entry).
     """
     if isinstance(arr, BaseExtensionArray):
-        return arr[index]
+        # Skipping the `__getitem__` index type dispatch.
+        return arr.__arrowbic_getitem__(index)
     elif isinstance(arr, pa.ExtensionArray):
         return arr.storage[index].as_py()
     else:
         return arr[index].as_py()
+
+
+@overload
+def get_pylist(arr: BaseExtensionArray[TItem]) -> List[Optional[TItem]]:
+    ...
+
+
+@overload
+def get_pylist(arr: pa.StringArray) -> List[Optional[str]]:
+    ...
+
+
+def get_pylist(arr: pa.Array) -> List[Optional[Any]]:
+    """Get the list of Python item objects from an array. Equivalent to calling `get_pyitem` on
+    every index, but using the PyArrow/Arrowbic bulk conversion.
+
+    This method is supporting Arrowbic extension arrays as well as PyArrow arrays.
+
+    Args:
+        arr: PyArrow or/and Arrowbic array.
+    Returns:
+        List of items (None for null entries).
+    """
+    if isinstance(arr, BaseExtensionArray):
+        return arr.to_pylist()
+    elif isinstance(arr, pa.ExtensionArray):
+        return arr.storage.to_pylist()
+    else:
+        return arr.to_pylist()
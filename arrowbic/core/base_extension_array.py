@@ -2,14 +2,54 @@
 """
 from typing import Any, Iterable, Iterator, List, Optional, Sequence, Type, TypeVar, Union, overload
 
+import numpy as np
 import pyarrow as pa
 
+from .base_types import NdArrayGeneric, from_arrow_to_numpy_dtype
+
 TItem = TypeVar("TItem")
 TArray = TypeVar("TArray", bound="BaseExtensionArray[Any]")
 
+_iter_chunk_size: int = 4096
+"""Chunk size used when iterating over an Arrowbic array (items converted in bulk with `to_pylist`).
+"""
+
 
 class BaseExtensionArray(pa.ExtensionArray, Sequence[Optional[TItem]]):
-    """Base extension array, adding interface to make simple operations easier."""
+    """Base extension array, adding interface to make simple operations easier.
+
+    NOTE: no instance `__dict__` on Arrowbic arrays. Sub-classes should also declare `__slots__`,
+    containing only additional (cached) fields. The storage array and item Python class are cached at first access.
+    """
+
+    __slots__ = ("_storage_cache", "_item_pyclass_cache")
+
+    @property
+    def storage(self) -> pa.Array:
+        """Storage array, cached on the instance: PyArrow builds a new Python wrapper at every access."""
+        try:
+            # Direct slot access: avoiding any sub-class `__getattr__` fallback.
+            return _storage_cache_slot.__get__(self)
+        except AttributeError:
+            storage = pa.ExtensionArray.storage.__get__(self)
+            self._storage_cache = storage
+            return storage
+
+    @property
+    def item_pyclass(self) -> Type[TItem]:
+        """Item Python class of the extension type, cached on the instance.
+
+        Raises:
+            TypeError: if the extension type has no item Python class associated (i.e. root extension type).
+        """
+        try:
+            return _item_pyclass_cache_slot.__get__(self)
+        except AttributeError:
+            item_pyclass = self.type.item_pyclass
+            if item_pyclass is None:
+                raise TypeError(f"No item Python class associated with the extension type '{self.type}'.")
+            self._item_pyclass_cache = item_pyclass
+            return item_pyclass
 
     @classmethod
     def __arrowbic_ext_type_class__(cls) -> Type[pa.ExtensionType]:
@@ -27,8 +67,16 @@ class BaseExtensionArray(pa.ExtensionArray, Sequence[Optional[TItem]]):
         raise NotImplementedError()
 
     def __iter__(self) -> Iterator[Optional[TItem]]:
-        """Default iterator implementation on Arrowbic extension arrays."""
-        return (self.__arrowbic_getitem__(idx) for idx in range(len(self)))
+        """Default iterator implementation on Arrowbic extension arrays.
+
+        Items are converted by chunks using `to_pylist`, on zero-copy slices of the array.
+        """
+        size = len(self)
+        if size <= _iter_chunk_size:
+            yield from self.to_pylist()
+            return
+        for start in range(0, size, _iter_chunk_size):
+            yield from self[start : start + _iter_chunk_size].to_pylist()
 
     @overload
     def __getitem__(self, index: int) -> Optional[TItem]:
@@ -42,13 +90,17 @@ class BaseExtensionArray(pa.ExtensionArray, Sequence[Optional[TItem]]):
         """Slice an Arrowbic extension array (or get a single item).
 
         Args:
-            key: Integer or slice. NOTE: for slicing, we rely fully on PyArrow implementation, which
-                may end up copy part of the input array.
+            key: Integer or slice. NOTE: contiguous slices are zero-copy. For strided slicing, we rely fully
+                on PyArrow implementation, which may end up copy part of the input array.
         Returns:
             Sliced Arrowbic array or Python item object.
         """
         if isinstance(index, slice):
-            # Use PyArrow directly for slicing.
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                # Zero-copy slice of the extension array, no storage re-wrapping.
+                return self.slice(start, max(stop - start, 0))
+            # Use PyArrow directly for strided slicing.
             raw_array = self.storage[index]
             return self.from_storage(self.type, raw_array)
         elif isinstance(index, int):
@@ -58,7 +110,33 @@ class BaseExtensionArray(pa.ExtensionArray, Sequence[Optional[TItem]]):
 
     def to_pylist(self) -> List[Optional[TItem]]:
         """Convert to a list of Python items."""
-        return list(self)
+        return [self.__arrowbic_getitem__(idx) for idx in range(len(self))]
+
+    def to_numpy_view(self) -> NdArrayGeneric:
+        """Convert the storage array to Numpy, zero-copy when possible.
+
+        For fixed-width numeric (and timestamp/duration) storage without nulls, the Numpy array is a direct
+        (read-only) view of the Arrow data buffer. Otherwise, falling back to PyArrow `to_numpy` conversion.
+
+        Returns:
+            Numpy array of the raw storage values.
+        """
+        storage = self.storage
+        awtype = storage.type
+        is_fixed_width = (
+            pa.types.is_integer(awtype)
+            or pa.types.is_floating(awtype)
+            or pa.types.is_timestamp(awtype)
+            or pa.types.is_duration(awtype)
+        )
+        if is_fixed_width and storage.null_count == 0:
+            dtype = np.dtype(from_arrow_to_numpy_dtype(awtype))
+            data = storage.buffers()[1]
+            values = np.frombuffer(data, dtype=dtype, count=len(storage), offset=storage.offset * dtype.itemsize)
+            # Arrow data is immutable: prevent in-place modification through the view.
+            values.flags.writeable = False
+            return values
+        return storage.to_numpy(zero_copy_only=False)
 
     def tolist(self) -> List[Optional[TItem]]:
         """Convert to a list of Python items. Alias of `to_pylist`"""
@@ -87,3 +165,7 @@ class BaseExtensionArray(pa.ExtensionArray, Sequence[Optional[TItem]]):
         ext_type_cls: BaseExtensionType = cls.__arrowbic_ext_type_class__()  # type:ignore
         arr = ext_type_cls.__arrowbic_from_item_iterator__(it_items, size=size, registry=registry)
         return arr
+
+
+_storage_cache_slot = BaseExtensionArray._storage_cache  # type:ignore
+_item_pyclass_cache_slot = BaseExtensionArray._item_pyclass_cache  # type:ignore
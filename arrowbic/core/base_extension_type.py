@@ -1,5 +1,6 @@
 """Implementation of base extension type class used in Arrowbic.
 """
+import functools
 import json
 from typing import Any, Dict, Iterable, Optional, Type, TypeVar
 
@@ -8,12 +9,32 @@ import pyarrow as pa
 from .base_extension_array import BaseExtensionArray
 from .utils import as_immutable
 
+try:
+    # Optional faster JSON encoding.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type:ignore
+
 TItem = TypeVar("TItem")
 TExtType = TypeVar("TExtType", bound="BaseExtensionType")
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """Compact JSON encoding of a Python object, using `orjson` if installed.
+
+    Args:
+        obj: Python object.
+    Returns:
+        UTF-8 JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@functools.lru_cache(maxsize=1024)
 def make_extension_name(extension_basename: str, package_name: str) -> str:
-    """Make a full Arrowbic extension name.
+    """Make a full Arrowbic extension name (cached, i.e. the same string object shared by all extension types).
 
     Args:
         extension_basename: Extension basename.
@@ -43,6 +64,15 @@ class BaseExtensionType(pa.ExtensionType):
         registry: Optional Arrowbic registry (global one by default).
     """
 
+    __slots__ = (
+        "_package_name",
+        "_item_pyclass",
+        "_item_pyclass_name",
+        "_extension_basename",
+        "_extension_name",
+        "_serialized_cache",
+    )
+
     def __init__(
         self,
         storage_type: Optional[pa.DataType] = None,
@@ -53,21 +83,27 @@ class BaseExtensionType(pa.ExtensionType):
     ):
         self._package_name: str = package_name or "core"
         self._item_pyclass = item_pyclass
+        # Names computed once: used in every metadata generation (equality, hashing, ...).
+        self._item_pyclass_name: Optional[str] = item_pyclass.__name__ if item_pyclass is not None else None
+        self._extension_basename: str = self.__arrowbic_ext_basename__()
+        # Serialized metadata, cached at first use (extension types are immutable).
+        self._serialized_cache: Optional[bytes] = None
 
         # Generate the full extension name for PyArrow extension registry.
-        extension_name = make_extension_name(self.extension_basename, self._package_name)
+        extension_name = make_extension_name(self._extension_basename, self._package_name)
+        self._extension_name: str = extension_name
         storage_type = storage_type if storage_type is not None else pa.null()
         pa.ExtensionType.__init__(self, storage_type, extension_name)
 
     @property
     def extension_name(self) -> str:
         """Get the extension full name."""
-        return super().extension_name
+        return self._extension_name
 
     @property
     def extension_basename(self) -> str:
         """Get the extension base name (i.e. casual name)."""
-        return self.__arrowbic_ext_basename__()
+        return self._extension_basename
 
     @property
     def package_name(self) -> str:
@@ -85,8 +121,7 @@ class BaseExtensionType(pa.ExtensionType):
     @property
     def item_pyclass_name(self) -> Optional[str]:
         """Get the item Python class name. None if no item class."""
-        item_pyclass_name = self._item_pyclass.__name__ if self._item_pyclass is not None else None
-        return item_pyclass_name
+        return self._item_pyclass_name
 
     def __eq__(self, other: object) -> bool:
         """Arrowbic extension type equality: if storage type is the same + metadata equal."""
@@ -170,7 +205,9 @@ class BaseExtensionType(pa.ExtensionType):
 
         Args:
             it_items: Items Python iterable.
-            size: Optional size of the input iterable.
+            size: Optional size of the input iterable. When provided, implementations should only consume
+                `size` items (e.g. with `first_items_in_iterable`, keeping sequence inputs uncopied), and can use
+                it to pre-allocate the storage buffers.
             registry: Optional registry where to find the extension type.
         Returns:
             Extension array, with the proper data.
@@ -182,10 +219,12 @@ class BaseExtensionType(pa.ExtensionType):
         """Standard Arrow(bic) serialization of the extension type metadata.
 
         By default, to keep the serialized metadata potentially compatible with all
-        Arrow backends, the metadata Arrowbic dictionary is encoded using JSON.
+        Arrow backends, the metadata Arrowbic dictionary is encoded using JSON (with `orjson` if available).
         """
-        ext_metadata = self.__arrowbic_ext_metadata__()
-        return json.dumps(ext_metadata).encode()
+        if self._serialized_cache is None:
+            ext_metadata = self.__arrowbic_ext_metadata__()
+            self._serialized_cache = _json_dumps(ext_metadata)
+        return self._serialized_cache
 
     @classmethod
     def __arrow_ext_deserialize__(cls, storage_type: pa.DataType, serialized: bytes) -> "BaseExtensionType":
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import numpy as np
 import pyarrow as pa
@@ -42,6 +42,32 @@ _base_from_arrow_to_python_mapping: Dict[pa.DataType, DTypeLike] = {
 """Mapping between supported base types and the Python (or Numpy dtype) equivalent.
 """
 
+_base_from_arrow_id_to_python_mapping: Dict[int, DTypeLike] = {
+    k.id: v
+    for k, v in _base_from_arrow_to_python_mapping.items()
+    if not (pa.types.is_timestamp(k) or pa.types.is_duration(k))
+}
+"""Same mapping, keyed by Arrow type id, for non-parametric types (i.e. fully defined by the type id).
+"""
+
+
+def _find_base_python_class(type: Any) -> Optional[DTypeLike]:
+    """Find the Python class (or Numpy dtype) equivalent of a base Arrow type.
+
+    Non-parametric Arrow types are directly found from their integer type id, avoiding
+    the Arrow type hashing and equality comparison.
+
+    Args:
+        type: PyArrow type (or any object).
+    Returns:
+        Python class (or Numpy dtype) equivalent, None if not a supported base type.
+    """
+    if isinstance(type, pa.DataType):
+        pyclass = _base_from_arrow_id_to_python_mapping.get(type.id)
+        if pyclass is not None:
+            return pyclass
+    return _base_from_arrow_to_python_mapping.get(type)
+
 
 def is_supported_base_type(type: pa.DataType) -> bool:
     """Is the input type a supported base type?
@@ -51,13 +77,63 @@ def is_supported_base_type(type: pa.DataType) -> bool:
     Returns:
         Is it a supported base type?
     """
-    return type in _base_from_arrow_to_python_mapping
+    return _find_base_python_class(type) is not None
+
+
+def _make_numpy_num_to_arrow_mapping() -> Dict[int, pa.DataType]:
+    """Build the mapping between Numpy non-parametric dtypes (keyed by dtype `num`) and Arrow types.
+
+    Datetime and timedelta dtypes are not part of it, as the time unit is not encoded in the dtype `num`.
+    """
+    mapping: Dict[int, pa.DataType] = {}
+    for typecode in "?" + np.typecodes["AllInteger"] + np.typecodes["Float"] + "US":
+        try:
+            mapping[np.dtype(typecode).num] = pa.from_numpy_dtype(np.dtype(typecode))
+        except (NotImplementedError, TypeError, pa.ArrowNotImplementedError):
+            pass
+    return mapping
+
+
+_numpy_num_to_arrow_mapping: Dict[int, pa.DataType] = _make_numpy_num_to_arrow_mapping()
+"""Mapping between Numpy dtypes `num` and Arrow types, for non-parametric dtypes.
+"""
+
+
+def _make_pyclass_to_arrow_mapping() -> Dict[Any, pa.DataType]:
+    """Build the mapping between Python base classes (and Numpy non-parametric scalar classes) and Arrow types."""
+    mapping: Dict[Any, pa.DataType] = {
+        type(None): pa.null(),
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        bytes: pa.binary(),
+    }
+    for typecode in "?" + np.typecodes["AllInteger"] + np.typecodes["Float"] + "US":
+        try:
+            mapping[np.dtype(typecode).type] = pa.from_numpy_dtype(np.dtype(typecode))
+        except (NotImplementedError, TypeError, pa.ArrowNotImplementedError):
+            pass
+    return mapping
+
+
+_pyclass_to_arrow_mapping: Dict[Any, pa.DataType] = _make_pyclass_to_arrow_mapping()
+"""Mapping between Python base classes (and Numpy scalar classes) and Arrow types.
+"""
 
 
 def from_numpy_to_arrow_type(dtype: DTypeLike) -> pa.DataType:
     """Convert a Numpy dtype (or Python base class) to an equivalent Arrow type."""
     if isinstance(dtype, pa.DataType):
         return dtype
+    if isinstance(dtype, np.dtype):
+        awtype = _numpy_num_to_arrow_mapping.get(dtype.num)
+        if awtype is not None:
+            return awtype
+    elif isinstance(dtype, type):
+        awtype = _pyclass_to_arrow_mapping.get(dtype)
+        if awtype is not None:
+            return awtype
 
     # Let's handle a few corner cases!
     if isinstance(dtype, np.dtype) and dtype == np.dtype("O"):
@@ -69,8 +145,30 @@ def from_numpy_to_arrow_type(dtype: DTypeLike) -> pa.DataType:
     return pa.from_numpy_dtype(dtype)
 
 
+_arrow_to_numpy_dtype_cache: Dict[Any, DTypeLike] = {}
+"""Memoized Arrow to Numpy dtype conversions, keyed by Arrow type id (and time unit for timestamp/duration).
+"""
+
+
 def from_arrow_to_numpy_dtype(awtype: pa.DataType) -> DTypeLike:
     """Convert an Arrow type to an equivalent Numpy dtype."""
+    if isinstance(awtype, pa.DataType):
+        # Base types fully defined by type id (and time unit): no Arrow type hashing nor equality comparison.
+        if awtype.id in _base_from_arrow_id_to_python_mapping:
+            key: Any = awtype.id
+        elif pa.types.is_timestamp(awtype) or pa.types.is_duration(awtype):
+            key = (awtype.id, awtype.unit)
+        else:
+            return _from_arrow_to_numpy_dtype(awtype)
+        dtype = _arrow_to_numpy_dtype_cache.get(key)
+        if dtype is None:
+            dtype = _from_arrow_to_numpy_dtype(awtype)
+            _arrow_to_numpy_dtype_cache[key] = dtype
+        return dtype
+    return _from_arrow_to_numpy_dtype(awtype)
+
+
+def _from_arrow_to_numpy_dtype(awtype: pa.DataType) -> DTypeLike:
     if isinstance(awtype, np.dtype):
         return type
 
@@ -98,4 +196,7 @@ def from_arrow_to_python_class(type: pa.DataType) -> DTypeLike:
     For now, Arrowbic is using Numpy dtype for timestamp and duration conversion, to keep
     the proper time unit information.
     """
-    return _base_from_arrow_to_python_mapping[type]
+    pyclass = _find_base_python_class(type)
+    if pyclass is None:
+        raise KeyError(f"Arrow type '{type}' is not a supported base type.")
+    return pyclass
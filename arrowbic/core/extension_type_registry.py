@@ -1,7 +1,8 @@
 """Arrowbic extension type main registry implementation.
 """
+import bisect
 import logging
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 import pyarrow as pa
 
@@ -10,6 +11,10 @@ from .base_extension_type import BaseExtensionType
 TItem = TypeVar("TItem")
 TExtType = TypeVar("TExtType", bound=BaseExtensionType)
 
+_extension_types_cache_maxsize: int = 1024
+"""Maximum number of cached extension types per registry (oldest entries evicted first).
+"""
+
 
 class ExtensionTypeRegistry:
     """The Arrowbic extension type registry is wrapping the PyArrow extension registry, with additional
@@ -30,8 +35,22 @@ class ExtensionTypeRegistry:
         self._sync_with_pyarrow = sync_with_pyarrow
         # Root extension types, i.e. not attached to a particular item Python class.
         self._root_extension_types: Dict[str, BaseExtensionType] = {}
-        # Cache associating item Python classes to extension types (with all variations of storage type).
-        self._item_pyclasses_cache: Dict[Type[Any], Dict[pa.DataType, BaseExtensionType]] = {}
+        # Root extension types ordered per decreasing Arrowbic priority (and then registration order),
+        # with the parallel list of sorting keys.
+        self._root_extension_types_sorted: List[BaseExtensionType] = []
+        self._root_extension_sort_keys: List[Tuple[int, int]] = []
+        # Flat cache associating (item Python class, storage type) to extension types (None storage type for root).
+        # Bounded, in order to avoid unlimited memory growth when generating many different storage types.
+        self._item_pyclasses_cache: Dict[Tuple[Type[Any], Optional[pa.DataType]], BaseExtensionType] = {}
+        # Identity cache keyed by (item Python class, id(storage type)), avoiding the hashing of storage types.
+        # The storage type object is kept alive in the entry, so that its id can not be re-used while cached.
+        self._item_pyclasses_identity_cache: Dict[
+            Tuple[Type[Any], int], Tuple[Optional[pa.DataType], BaseExtensionType]
+        ] = {}
+        # Memoized association item Python class => root extension type (reset when a root type is registered).
+        self._associated_root_cache: Dict[Type[Any], BaseExtensionType] = {}
+        # Direct mapping item Python class => root extension type (hot path of the `array` factory).
+        self._item_pyclasses_root: Dict[Type[Any], BaseExtensionType] = {}
 
     def register_root_extension_type(self, extension_type: BaseExtensionType) -> None:
         """Register a (root) extension type in an Arrowbic registry.
@@ -51,14 +70,14 @@ class ExtensionTypeRegistry:
             raise ValueError(f"The extension type '{extension_name}' is already registered in Arrowbic.")
 
         # Insert the root extension type, i.e. without item Python class associated.
+        # Keeping the names ordered per decreasing Arrowbic priority (stable w.r.t. registration order).
+        sort_key = (-extension_type.__arrowbic_priority__(), len(self._root_extension_types))
+        sort_index = bisect.bisect_right(self._root_extension_sort_keys, sort_key)
+        self._root_extension_sort_keys.insert(sort_index, sort_key)
+        self._root_extension_types_sorted.insert(sort_index, extension_type)
         self._root_extension_types[extension_name] = extension_type
-        # Re-order the extension types per decreasing Arrowbic priority.
-        self._root_extension_types = dict(
-            sorted(
-                self._root_extension_types.items(),
-                key=lambda x: -x[1].__arrowbic_priority__(),
-            )
-        )
+        # New root type, possibly with higher priority: association to be re-computed.
+        self._associated_root_cache.clear()
         if self._sync_with_pyarrow:
             pa.register_extension_type(extension_type)
 
@@ -72,13 +91,15 @@ class ExtensionTypeRegistry:
         Raises:
             KeyError: if no Arrowbic extension type found compatible with the Python class.
         """
-        if item_pyclass in self._item_pyclasses_cache:
+        if item_pyclass in self._item_pyclasses_root:
             logging.warning(f"The item Python class '{item_pyclass}' has already been registered in Arrowbic.")
-            return self._item_pyclasses_cache[item_pyclass][pa.null()]
+            return self._item_pyclasses_root[item_pyclass]
 
         root_ext_type = self._associate_item_pyclass_to_root_extension_type(item_pyclass)
-        # Default entry, with the null storage type corresponding to the root extension type.
-        self._item_pyclasses_cache[item_pyclass] = {pa.null(): root_ext_type}
+        # Default entries, with the null storage type corresponding to the root extension type.
+        self._item_pyclasses_cache[(item_pyclass, None)] = root_ext_type
+        self._item_pyclasses_cache[(item_pyclass, pa.null())] = root_ext_type
+        self._item_pyclasses_root[item_pyclass] = root_ext_type
         return root_ext_type
 
     def unregister_item_pyclass(self, item_pyclass: Type[Any]) -> None:
@@ -87,7 +108,21 @@ class ExtensionTypeRegistry:
         Args:
             item_pyclass: Item Python class to unregister.
         """
-        self._item_pyclasses_cache.pop(item_pyclass)
+        self._item_pyclasses_root.pop(item_pyclass)
+        self._item_pyclasses_cache = {k: v for k, v in self._item_pyclasses_cache.items() if k[0] is not item_pyclass}
+        self._item_pyclasses_identity_cache = {
+            k: v for k, v in self._item_pyclasses_identity_cache.items() if k[0] is not item_pyclass
+        }
+
+    def find_root_extension_type_or_none(self, item_pyclass: Type[Any]) -> Optional[BaseExtensionType]:
+        """Find the root extension type associated with an item Python class.
+
+        Args:
+            item_pyclass: Item Python class.
+        Returns:
+            Root Arrowbic extension type, or None if the item Python class is not registered.
+        """
+        return self._item_pyclasses_root.get(item_pyclass)
 
     def find_extension_type(
         self, item_pyclass: Type[Any], storage_type: Optional[pa.DataType] = None
@@ -102,14 +137,21 @@ class ExtensionTypeRegistry:
         Raises:
             KeyError: if the item Python class was not registered.
         """
-        if item_pyclass not in self._item_pyclasses_cache:
+        # Identity lookup first: no (potentially costly) hashing of nested storage types.
+        identity_key = (item_pyclass, id(storage_type))
+        identity_entry = self._item_pyclasses_identity_cache.get(identity_key)
+        if identity_entry is not None and identity_entry[0] is storage_type:
+            return identity_entry[1]
+        # Single flat dictionary lookup on the hot path.
+        ext_type = self._item_pyclasses_cache.get((item_pyclass, storage_type))
+        if ext_type is not None:
+            self._cache_identity_entry(identity_key, storage_type, ext_type)
+            return ext_type
+        root_ext_type = self._item_pyclasses_root.get(item_pyclass)
+        if root_ext_type is None:
             raise KeyError(f"The item Python class '{item_pyclass}' is not registered in Arrowbic.")
-        item_pyclass_types_cache = self._item_pyclasses_cache[item_pyclass]
-        root_ext_type = item_pyclass_types_cache[pa.null()]
-        if storage_type is None:
+        if storage_type is None or storage_type == pa.null():
             return root_ext_type
-        if storage_type in item_pyclass_types_cache:
-            return item_pyclass_types_cache[storage_type]
 
         # Generate the proper extension type when not existing.
         ext_type = type(root_ext_type)(
@@ -117,9 +159,21 @@ class ExtensionTypeRegistry:
             item_pyclass=item_pyclass,
             package_name=root_ext_type.package_name,
         )
-        item_pyclass_types_cache[storage_type] = ext_type
+        if len(self._item_pyclasses_cache) >= _extension_types_cache_maxsize:
+            # Evict the oldest entry (dictionary insertion order).
+            del self._item_pyclasses_cache[next(iter(self._item_pyclasses_cache))]
+        self._item_pyclasses_cache[(item_pyclass, storage_type)] = ext_type
+        self._cache_identity_entry(identity_key, storage_type, ext_type)
         return ext_type
 
+    def _cache_identity_entry(
+        self, identity_key: Tuple[Type[Any], int], storage_type: Optional[pa.DataType], ext_type: BaseExtensionType
+    ) -> None:
+        """Add an entry to the (bounded) identity cache of extension types."""
+        if len(self._item_pyclasses_identity_cache) >= _extension_types_cache_maxsize:
+            del self._item_pyclasses_identity_cache[next(iter(self._item_pyclasses_identity_cache))]
+        self._item_pyclasses_identity_cache[identity_key] = (storage_type, ext_type)
+
     def _associate_item_pyclass_to_root_extension_type(self, item_pyclass: Type[Any]) -> BaseExtensionType:
         """Find the root extension type to associate to an item Python class.
 
@@ -130,15 +184,37 @@ class ExtensionTypeRegistry:
         Raises:
             KeyError: if no matching extension type is found.
         """
-        for extension_type in self._root_extension_types.values():
+        root_ext_type = self._associated_root_cache.get(item_pyclass)
+        if root_ext_type is not None:
+            return root_ext_type
+        for extension_type in self._root_extension_types_sorted:
             if extension_type.__arrowbic_is_item_pyclass_supported__(item_pyclass):
+                self._associated_root_cache[item_pyclass] = extension_type
                 return extension_type
         raise KeyError(f"Could not find any Arrowbic extension type to associate to the Python class '{item_pyclass}'.")
 
+    def clone(self) -> "ExtensionTypeRegistry":
+        """Clone the registry, as a lightweight alternative to `copy.deepcopy`.
+
+        Only the internal collections are copied: extension types are immutable, and shared with the clone.
+
+        Returns:
+            New registry, independent from the present one.
+        """
+        registry = ExtensionTypeRegistry(sync_with_pyarrow=self._sync_with_pyarrow)
+        registry._root_extension_types = dict(self._root_extension_types)
+        registry._root_extension_types_sorted = list(self._root_extension_types_sorted)
+        registry._root_extension_sort_keys = list(self._root_extension_sort_keys)
+        registry._item_pyclasses_cache = dict(self._item_pyclasses_cache)
+        registry._item_pyclasses_identity_cache = dict(self._item_pyclasses_identity_cache)
+        registry._associated_root_cache = dict(self._associated_root_cache)
+        registry._item_pyclasses_root = dict(self._item_pyclasses_root)
+        return registry
+
     @property
     def root_extension_types(self) -> List[BaseExtensionType]:
-        """Get all the root registered extension types."""
-        return list(self._root_extension_types.values())
+        """Get all the root registered extension types, ordered per decreasing Arrowbic priority."""
+        return list(self._root_extension_types_sorted)
 
 
 _global_registry = ExtensionTypeRegistry(sync_with_pyarrow=True)
@@ -228,3 +304,25 @@ def find_registry_extension_type(
     """
     registry = registry or _global_registry
     return registry.find_extension_type(item_pyclass, storage_type)
+
+
+def find_registry_extension_type_or_none(
+    item_pyclass: Type[TItem],
+    storage_type: Optional[pa.DataType] = None,
+    *,
+    registry: Optional[ExtensionTypeRegistry] = None,
+) -> Optional[BaseExtensionType]:
+    """Find an extension type in the Arrowbic registry, returning None if the item Python class
+    is not registered (i.e. no exception raised).
+
+    Args:
+        item_pyclass: Item Python class to find in the registry.
+        storage_type: Storage type to use for the extension type.
+        registry: Optional registry to use.
+    Returns:
+        Extension type from the registry, or None if the item Python class is not registered.
+    """
+    registry = registry or _global_registry
+    if registry.find_root_extension_type_or_none(item_pyclass) is None:
+        return None
+    return registry.find_extension_type(item_pyclass, storage_type)
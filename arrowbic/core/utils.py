@@ -1,7 +1,11 @@
+import functools
 import itertools
-from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, overload
+import keyword
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, cast, overload
 
 import immutables
+import numpy as np
 
 from .base_types import NdArrayGeneric
 
@@ -35,18 +39,86 @@ def first_valid_item_in_iterable(it_items: Iterable[Optional[T]]) -> Tuple[int,
         First non-none item (or None if everything consumed).
         Iterable of all items (same as input if it is a sequence type).
     """
-    idx = 0
-    consumed_values = []
-    is_random_access = hasattr(it_items, "__getitem__")
+    # Numpy arrays: only object arrays can contain None items.
+    if isinstance(it_items, np.ndarray) and it_items.dtype.kind != "O" and len(it_items) > 0:
+        return (0, it_items[0], it_items)
+    # Lists, tuples and 1d Numpy arrays: C-level scan of the non-none flags (no Python loop on leading None items).
+    # NOTE: identity check, not calling the items `__ne__` (e.g. ambiguous on Numpy arrays in object arrays).
+    if isinstance(it_items, (list, tuple)) or (isinstance(it_items, np.ndarray) and it_items.ndim == 1):
+        if len(it_items) > 0 and it_items[0] is not None:
+            return (0, it_items[0], it_items)
+        valid_flags = map(operator.is_not, it_items, itertools.repeat(None))
+        idx = next(itertools.compress(itertools.count(), valid_flags), len(it_items))
+        return (idx, it_items[idx] if idx < len(it_items) else None, it_items)
+    # Other random access iterables: direct scan, no need to keep track of the consumed items.
+    if hasattr(it_items, "__getitem__"):
+        idx = 0
+        for v in it_items:
+            if v is not None:
+                return (idx, v, it_items)
+            idx += 1
+        return (idx, None, it_items)
+
+    # Generic iterator: consumed items need to be prepended.
+    consumed_values: List[Optional[T]] = []
     for v in it_items:
-        consumed_values.append(v)
         if v is not None:
-            # Need to prepend consumed items if not a random access iterable.
-            if not is_random_access:
-                it_items = itertools.chain(iter(consumed_values), it_items)
-            return (idx, v, it_items)
-        idx += 1
-    return (idx, None, consumed_values)
+            idx = len(consumed_values)
+            consumed_values.append(v)
+            return (idx, v, itertools.chain(consumed_values, it_items))
+        consumed_values.append(v)
+    return (len(consumed_values), None, consumed_values)
+
+
+def first_items_in_iterable(it_items: Iterable[T], size: Optional[int]) -> Iterable[T]:
+    """Restrict an iterable to its first `size` items.
+
+    Lists and tuples are kept as sequences (returned as is when not longer than `size`, sliced otherwise),
+    preserving the sequence fast paths of array builders.
+
+    Args:
+        it_items: Items iterable.
+        size: Optional maximum number of items (no restriction if None).
+    Returns:
+        Iterable of the first `size` items.
+    """
+    if size is None:
+        return it_items
+    if isinstance(it_items, (list, tuple)):
+        return it_items if len(it_items) <= size else it_items[:size]
+    return itertools.islice(it_items, size)
+
+
+def items_to_columns(items: Iterable[Optional[Any]], field_names: Sequence[str]) -> Tuple[List[Any], ...]:
+    """Transpose Python items into columns of attribute values.
+
+    Args:
+        items: Items iterable. None items give None values in every column.
+        field_names: Attribute names to extract from the items.
+    Returns:
+        Tuple of columns (Python lists), one per field name.
+    Raises:
+        ValueError: if a field name is not a valid Python identifier.
+    """
+    items = items if isinstance(items, (list, tuple)) else list(items)
+    return _make_items_to_columns_function(tuple(field_names))(items)
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_items_to_columns_function(field_names: Tuple[str, ...]) -> Callable[[Sequence[Any]], Tuple[List[Any], ...]]:
+    """Generate the items to columns transpose function specialized to a collection of field names.
+
+    Every column is built by a list comprehension with a direct attribute access, which is faster in CPython
+    than generic `getattr`/`attrgetter` calls followed by a transpose.
+    """
+    for name in field_names:
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"Invalid field name '{name}': not a Python identifier.")
+    columns_src = "".join(f"        [v.{name} if v is not None else None for v in items],\n" for name in field_names)
+    src = f"def _items_to_columns(items):\n    return (\n{columns_src}    )\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, "<arrowbic-items-to-columns>", "exec"), namespace)
+    return cast(Callable[[Sequence[Any]], Tuple[List[Any], ...]], namespace["_items_to_columns"])
 
 
 @overload
@@ -99,10 +171,43 @@ def as_immutable(obj: Any) -> Any:
     Raises:
         TypeError: if can not convert the input to an equivalent immutable object.
     """
+    # Fast path: exact type dispatch. Sub-classes handled by the generic `isinstance` checks.
+    handler = _as_immutable_dispatch.get(type(obj))
+    if handler is not None:
+        return handler(obj)
     if isinstance(obj, (type(None), int, float, bytes, str)):
         return obj
     elif isinstance(obj, (tuple, list)):
         return tuple(obj)
     elif isinstance(obj, dict):
-        return immutables.Map({k: as_immutable(v) for k, v in obj.items()})
+        return _dict_as_immutable(obj)
     raise TypeError(f"Can not convert to immutable the object '{obj}'.")
+
+
+def _identity(obj: T) -> T:
+    """Identity conversion, for objects already immutable."""
+    return obj
+
+
+def _dict_as_immutable(obj: Dict[Any, Any]) -> "immutables.Map[Any, Any]":
+    """Convert a dictionary to an immutable map, filling directly the map mutation buffer (no intermediate dict)."""
+    mm: "immutables.MapMutation[Any, Any]"
+    with immutables.Map().mutate() as mm:
+        for k, v in obj.items():
+            mm[k] = as_immutable(v)
+    return mm.finish()
+
+
+_as_immutable_dispatch: Dict[type, Callable[[Any], Any]] = {
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    bytes: _identity,
+    str: _identity,
+    tuple: tuple,
+    list: tuple,
+    dict: _dict_as_immutable,
+}
+"""Exact type => immutable conversion handler.
+"""
@@ -1,12 +1,14 @@
 """Dataclass extension array implementation.
 """
-from typing import List, Optional, Type, TypeVar
+import itertools
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, cast
 
 import pyarrow as pa
 
-from arrowbic.core.array_ops import get_pyitem
-from arrowbic.core.base_extension_array import BaseExtensionArray
+from arrowbic.core.array_ops import asarray, get_pyitem, get_pylist
+from arrowbic.core.base_extension_array import BaseExtensionArray, _iter_chunk_size
 from arrowbic.core.base_extension_type import BaseExtensionType
+from arrowbic.core.extension_type_registry import ExtensionTypeRegistry, find_registry_extension_type
 
 TItem = TypeVar("TItem")
 
@@ -17,12 +19,56 @@ class DataclassArray(BaseExtensionArray[TItem]):
     This class can be sub-classed in order to get better typing in common IDE!
     """
 
+    __slots__ = ("_children_cache", "_field_index_cache")
+
     @classmethod
     def __arrowbic_ext_type_class__(cls) -> Type[BaseExtensionType]:
         from .dataclass_type import DataclassType
 
         return DataclassType
 
+    @classmethod
+    def from_field_arrays(
+        cls,
+        item_pyclass: Type[TItem],
+        arrays: Dict[str, Iterable[Any]],
+        *,
+        mask: Optional[Iterable[bool]] = None,
+        registry: Optional[ExtensionTypeRegistry] = None,
+    ) -> "DataclassArray[TItem]":
+        """Build a dataclass extension array directly from its field columns (i.e. struct of arrays).
+
+        No dataclass item is built or accessed: every field column is converted in bulk (zero-copy for
+        Arrow arrays, and Numpy base arrays when possible).
+
+        Args:
+            item_pyclass: Dataclass Python class of the items.
+            arrays: Mapping field name => column (Arrow (chunked) array, Numpy array or any Python iterable).
+            mask: Optional boolean mask (True for null items).
+            registry: Optional Arrowbic registry to use.
+        Returns:
+            Dataclass extension array.
+        Raises:
+            KeyError: if the array keys do not match the dataclass fields.
+        """
+        from .dataclass_type import _get_dataclass_fields, _make_struct_fields
+
+        field_names, _ = _get_dataclass_fields(cast(Hashable, item_pyclass))
+        if set(arrays.keys()) != set(field_names):
+            raise KeyError(
+                f"Field arrays keys {list(arrays.keys())} not matching the dataclass fields {list(field_names)}."
+            )
+        field_arrays = [asarray(arrays[name]) for name in field_names]
+        # Struct arrays require contiguous children: combine chunked field columns.
+        field_arrays = [arr.combine_chunks() if isinstance(arr, pa.ChunkedArray) else arr for arr in field_arrays]
+        aw_field_infos = _make_struct_fields(field_names, tuple(arr.type for arr in field_arrays))
+        if mask is not None and not isinstance(mask, pa.Array):
+            mask = pa.array(mask, type=pa.bool_())
+        storage_arr = pa.StructArray.from_arrays(field_arrays, fields=list(aw_field_infos), mask=mask)
+
+        ext_type = find_registry_extension_type(item_pyclass, storage_arr.type, registry=registry)
+        return cls.from_storage(ext_type, storage_arr)
+
     def __arrowbic_getitem__(self, index: int) -> Optional[TItem]:
         """Arrowbic __getitem__ interface, to retrieve a single IntEnum item in an array.
 
@@ -31,23 +77,121 @@ class DataclassArray(BaseExtensionArray[TItem]):
         Returns:
             Item (or None if null entry).
         """
-        raw_data = self.storage[index]
-        if not raw_data.is_valid:
+        storage = self.storage
+        # No struct scalar allocated to check validity when there are no nulls at all.
+        if storage.null_count > 0 and not storage[index].is_valid:
             return None
 
         # Extract the raw fields values, and the build the item dataclass object.
-        values = {f.name: get_pyitem(self.storage.field(c), index) for c, f in enumerate(self.storage.type)}
-        item_pyclass = self.type.item_pyclass
+        values = {k: get_pyitem(child, index) for k, child in zip(self._field_index, self._children)}
+        item_pyclass = self.item_pyclass
         item = item_pyclass(**values)
         return item
 
+    def to_pylist(self) -> List[Optional[TItem]]:
+        """Convert to a list of Python dataclass items.
+
+        Field columns are converted in bulk, and then zipped into dataclass objects.
+        """
+        from .dataclass_type import _get_dataclass_positional_fields
+
+        item_pyclass = self.item_pyclass
+        keys = self.keys()
+        if tuple(keys) == _get_dataclass_positional_fields(cast(Hashable, item_pyclass)):
+            # Same fields ordering in the storage and the dataclass `__init__`: positional arguments (no kwargs dict).
+            return [item_pyclass(*values) if is_valid else None for values, is_valid in self._iter_field_values()]
+        items = [
+            item_pyclass(**dict(zip(keys, values))) if is_valid else None
+            for values, is_valid in self._iter_field_values()
+        ]
+        return items
+
+    def iter_items(self, *, reuse_item: bool = False) -> Iterator[Optional[TItem]]:
+        """Iterate over the dataclass items, with the option of re-using the same item object.
+
+        When re-using the item, a single dataclass object is allocated, and its fields are overwritten
+        in-place at every step of the iteration: it avoids the allocation cost of one Python object per item,
+        but the caller must copy any item to be kept beyond the current step.
+
+        Args:
+            reuse_item: Re-use the same dataclass object for all (valid) items.
+        Returns:
+            Iterator over the items (None for null entries).
+        """
+        if not reuse_item:
+            yield from self
+            return
+
+        item_pyclass = self.item_pyclass
+        keys = self.keys()
+        item = item_pyclass.__new__(item_pyclass)
+        for values, is_valid in self._iter_field_values():
+            if not is_valid:
+                yield None
+                continue
+            # Works as well with frozen and slots dataclasses.
+            for k, v in zip(keys, values):
+                object.__setattr__(item, k, v)
+            yield item
+
+    def iter_views(self) -> Iterator[Optional[Tuple[Any, ...]]]:
+        """Iterate over lightweight named tuple views of the items, instead of dataclass objects.
+
+        Named tuples are built directly from the field values (no dataclass `__init__` call), which
+        makes bulk read-outs cheaper when the full dataclass object is not required.
+
+        Returns:
+            Iterator over the item views (None for null entries).
+        """
+        from .dataclass_type import DataclassType
+
+        view_pyclass = DataclassType.make_view_pyclass(self.type.item_pyclass_name, self.keys())
+        for values, is_valid in self._iter_field_values():
+            yield view_pyclass._make(values) if is_valid else None  # type:ignore
+
+    def _iter_field_values(self) -> Iterator[Tuple[Tuple[Any, ...], bool]]:
+        """Iterate over the raw field values of every item, converted in bulk per field column
+        (by chunks of the array).
+
+        Returns:
+            Iterator of pairs (field values, is valid).
+        """
+        for start in range(0, len(self), _iter_chunk_size):
+            chunk = self.storage[start : start + _iter_chunk_size]
+            columns = [get_pylist(chunk.field(c)) for c in range(chunk.type.num_fields)]
+            # Null entries in the struct storage.
+            validity = chunk.is_valid().to_pylist() if chunk.null_count > 0 else itertools.repeat(True)
+            yield from zip(zip(*columns), validity)
+
+    @property
+    def _children(self) -> Tuple[pa.Array, ...]:
+        """Struct storage field arrays, cached on the instance (avoiding a new child array at every item access)."""
+        try:
+            # Direct slot access: avoiding the `__getattr__` fallback.
+            return _children_cache_slot.__get__(self)
+        except AttributeError:
+            storage = self.storage
+            children = tuple(storage.field(c) for c in range(storage.type.num_fields))
+            self._children_cache = children
+            return children
+
+    @property
+    def _field_index(self) -> Dict[str, int]:
+        """Mapping field name => column index in the struct storage, cached on the instance."""
+        try:
+            return _field_index_cache_slot.__get__(self)
+        except AttributeError:
+            field_index = {f.name: c for c, f in enumerate(self.storage.type)}
+            self._field_index_cache = field_index
+            return field_index
+
     def keys(self) -> List[str]:
         """Get the list of keys/fields in the dataclass Arrowbic array.
 
         Returns:
             List of the keys.
         """
-        return [f.name for f in self.storage.type]
+        return list(self._field_index)
 
     def __getattr__(self, key: str) -> pa.Array:
         """Implement __getattr__ for the dataclass Arrowbic extension array.
@@ -61,8 +205,19 @@ class DataclassArray(BaseExtensionArray[TItem]):
             key: Column field key.
         Returns:
             Dataclass field array.
+        Raises:
+            AttributeError: If the key is not a field of the dataclass (making `hasattr` work as expected).
         """
-        keys = self.keys()
-        if key in keys:
-            return self.storage.field(keys.index(key))
-        raise KeyError(f"Unknown field '{key}' in the Arrowbic dataclass extension array. Available columns: {keys}.")
+        # Dunder probes (copy, pickle, IPython, ...): never dataclass fields.
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)
+        column = self._field_index.get(key)
+        if column is not None:
+            return self._children[column]
+        raise AttributeError(
+            f"Unknown field '{key}' in the Arrowbic dataclass extension array. Available columns: {self.keys()}."
+        )
+
+
+_children_cache_slot = DataclassArray._children_cache  # type:ignore
+_field_index_cache_slot = DataclassArray._field_index_cache  # type:ignore
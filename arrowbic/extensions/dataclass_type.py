@@ -1,12 +1,15 @@
 """Dataclass extension type implementation.
 """
+import collections
 import dataclasses
-import itertools
-from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar
+import functools
+import sys
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, cast
 
 import pyarrow as pa
-from typing_inspect import is_optional_type
+from typing_inspect import get_args, is_optional_type
 
+from arrowbic.core.array_ops import array as make_array
 from arrowbic.core.base_extension_type import BaseExtensionType
 from arrowbic.core.base_types import from_arrow_to_python_class, is_supported_base_type
 from arrowbic.core.extension_type_registry import (
@@ -14,7 +17,7 @@ from arrowbic.core.extension_type_registry import (
     find_registry_extension_type,
     register_extension_type,
 )
-from arrowbic.core.utils import first_valid_item_in_iterable
+from arrowbic.core.utils import first_items_in_iterable, first_valid_item_in_iterable, items_to_columns
 
 from .dataclass_array import DataclassArray
 
@@ -70,6 +73,106 @@ def _from_arrow_field_to_dataclass_field(field: pa.Field) -> Tuple[str, Type[Any
     raise TypeError(f"Could not convert PyArrow field '{field}' to equivalent dataclass field.")
 
 
+_base_field_arrow_types: Dict[Any, pa.DataType] = {
+    bool: pa.bool_(),
+    float: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+}
+"""Arrow types of dataclass fields annotated with a base Python type.
+
+NOTE: `int` is not part of it, as PyArrow silently truncates float values when converting to an integer type.
+"""
+
+
+def _get_field_base_pyclass(field_type: Any) -> Optional[Type[Any]]:
+    """Get the base Python type of a dataclass field annotation (or optional base type), if it has an Arrow type.
+
+    Args:
+        field_type: Dataclass field type annotation.
+    Returns:
+        Base Python type, or None if the field is not annotated with a base Python type.
+    """
+    if is_optional_type(field_type):
+        args = [t for t in get_args(field_type) if t is not type(None)]  # noqa: E721
+        if len(args) != 1:
+            return None
+        field_type = args[0]
+    return field_type if field_type in _base_field_arrow_types else None
+
+
+def _make_field_array(values: List[Any], field_type: Any) -> pa.Array:
+    """Build the Arrow array of a dataclass field from its Python values.
+
+    Fields annotated with a base Python type, with values of this exact type, are directly converted by PyArrow
+    with the explicit Arrow type (i.e. no type inference or registry dispatch). The resulting Arrow type is then
+    the same as PyArrow inference. Falling back on the generic `array` factory otherwise (e.g. int values
+    in a `float` field stay stored as int64).
+
+    Args:
+        values: Field values (None for null entries).
+        field_type: Dataclass field type annotation.
+    Returns:
+        Field Arrow(bic) array.
+    """
+    pyclass = _get_field_base_pyclass(field_type)
+    if pyclass is not None:
+        _, first_value, _ = first_valid_item_in_iterable(values)
+        if type(first_value) is pyclass:
+            try:
+                return pa.array(values, type=_base_field_arrow_types[pyclass])
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+                pass
+    return make_array(values)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_dataclass_fields(item_pyclass: Type[Any]) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+    """Get (and cache) the dataclass field names (interned) and type annotations of a dataclass."""
+    dc_fields = dataclasses.fields(item_pyclass)
+    return tuple(sys.intern(f.name) for f in dc_fields), tuple(f.type for f in dc_fields)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_dataclass_positional_fields(item_pyclass: Type[Any]) -> Optional[Tuple[str, ...]]:
+    """Get (and cache) the dataclass field names, if they can all be passed as positional arguments to `__init__`
+    (None otherwise, e.g. with `kw_only` or `init=False` fields).
+    """
+    dc_fields = dataclasses.fields(item_pyclass)
+    if any(not f.init or getattr(f, "kw_only", False) is True for f in dc_fields):
+        return None
+    return tuple(f.name for f in dc_fields)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_dataclass_fields_nullable(item_pyclass: Type[Any]) -> Tuple[Tuple[str, bool], ...]:
+    """Get (and cache) the dataclass field names and nullability (i.e. optional type annotation)."""
+    field_names, field_types = _get_dataclass_fields(cast(Hashable, item_pyclass))
+    return tuple((name, is_optional_type(ftype)) for name, ftype in zip(field_names, field_types))
+
+
+@functools.lru_cache(maxsize=256)
+def _make_dataclass(item_pyclass_name: str, fields_signature: Tuple[Tuple[str, Type[Any]], ...]) -> Type[Any]:
+    """Make (and cache) a dataclass definition from its name and fields (name, Python class).
+
+    Caching avoids the (expensive) code generation of `dataclasses.make_dataclass` on every read of the same schema.
+    """
+    fields = [(name, pyclass, dataclasses.field()) for name, pyclass in fields_signature]
+    return dataclasses.make_dataclass(item_pyclass_name, fields)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_struct_fields(field_names: Tuple[str, ...], field_types: Tuple[pa.DataType, ...]) -> Tuple[pa.Field, ...]:
+    """Make (and cache) the (nullable) Arrow struct fields of a dataclass storage type."""
+    return tuple(pa.field(name=name, type=ftype, nullable=True) for name, ftype in zip(field_names, field_types))
+
+
+@functools.lru_cache(maxsize=256)
+def _make_view_pyclass(item_pyclass_name: str, field_names: Tuple[str, ...]) -> Type[Tuple[Any, ...]]:
+    """Make (and cache) the named tuple view class of a dataclass."""
+    return collections.namedtuple(f"{item_pyclass_name}View", field_names, rename=True)
+
+
 @register_extension_type
 class DataclassType(BaseExtensionType):
     """Dataclass extension type.
@@ -84,6 +187,9 @@ class DataclassType(BaseExtensionType):
         registry: Optional Arrowbic registry (global one by default).
     """
 
+    # No instance dictionary: all the extension type state is in the base class slots.
+    __slots__ = ()
+
     def __init__(
         self,
         storage_type: Optional[pa.DataType] = None,
@@ -112,7 +218,8 @@ class DataclassType(BaseExtensionType):
         if self.item_pyclass is not None:
             # Serialize the dataclass definition.
             fields = [
-                {"name": f.name, "nullable": is_optional_type(f.type)} for f in dataclasses.fields(self.item_pyclass)
+                {"name": name, "nullable": nullable}
+                for name, nullable in _get_dataclass_fields_nullable(cast(Hashable, self.item_pyclass))
             ]
         metadata["fields"] = fields
         return metadata
@@ -148,9 +255,22 @@ class DataclassType(BaseExtensionType):
             raise TypeError("Can not build a dataclass definition from an Arrow null datatype.")
 
         item_pyclass_name = ext_metadata["item_pyclass_name"]
-        fields = [_from_arrow_field_to_dataclass_field(f) for f in storage_type]
-        item_pyclass = dataclasses.make_dataclass(item_pyclass_name, fields)
-        return item_pyclass
+        fields_signature = tuple(
+            (name, pyclass) for name, pyclass, _ in map(_from_arrow_field_to_dataclass_field, storage_type)
+        )
+        return _make_dataclass(item_pyclass_name, fields_signature)
+
+    @classmethod
+    def make_view_pyclass(cls, item_pyclass_name: str, field_names: Sequence[str]) -> Type[Tuple[Any, ...]]:
+        """Make a lightweight named tuple view class, equivalent to a dataclass definition.
+
+        Args:
+            item_pyclass_name: Name of the dataclass.
+            field_names: Field names of the dataclass.
+        Returns:
+            Named tuple class, with the same fields (cached per name and fields).
+        """
+        return _make_view_pyclass(item_pyclass_name, tuple(field_names))
 
     @classmethod
     def __arrowbic_from_item_iterator__(
@@ -170,26 +290,27 @@ class DataclassType(BaseExtensionType):
         Returns:
             Extension array, with the proper data.
         """
-        from arrowbic.core.array_ops import array as make_array
-
-        if size is not None:
-            it_items = itertools.islice(it_items, size)
+        it_items = first_items_in_iterable(it_items, size)
         # TODO: more efficient way than consuming the full iterator?
-        items = list(it_items)
-        _, first_item, items = first_valid_item_in_iterable(items)
+        # No additional copy pass when the input is already a Python sequence.
+        items: Sequence[Optional[TItem]] = it_items if isinstance(it_items, (list, tuple)) else list(it_items)
+        # Sequence input: returned as is, no need to re-bind the items.
+        _, first_item, _ = first_valid_item_in_iterable(items)
         # Null array directly!
         if first_item is None:
             return pa.nulls(len(items))
 
-        dc_field_infos = {f.name: f for f in dataclasses.fields(first_item)}
+        field_names, field_types = _get_dataclass_fields(cast(Hashable, type(first_item)))
         # Build individual field arrays.
+        columns = items_to_columns(items, field_names)
         field_arrays: Dict[str, pa.Array] = {
-            k: make_array([v.__dict__[k] if v is not None else None for v in items]) for k in dc_field_infos.keys()
+            name: _make_field_array(col, ftype) for name, ftype, col in zip(field_names, field_types, columns)
         }
-        # Struct array, with boolean mask.
-        mask = pa.array([v is None for v in items], type=pa.bool_())
-        aw_field_infos = [pa.field(name=k, type=arr.type, nullable=True) for k, arr in field_arrays.items()]
-        storage_arr = pa.StructArray.from_arrays(list(field_arrays.values()), fields=aw_field_infos, mask=mask)
+        # Struct array, with boolean mask (no validity bitmap at all when there are no nulls).
+        null_flags = [v is None for v in items]
+        mask = pa.array(null_flags, type=pa.bool_()) if any(null_flags) else None
+        aw_field_infos = _make_struct_fields(field_names, tuple(arr.type for arr in field_arrays.values()))
+        storage_arr = pa.StructArray.from_arrays(list(field_arrays.values()), fields=list(aw_field_infos), mask=mask)
 
         # Build the extension array, using registry extension type cache if existing.
         ext_tensor_type = find_registry_extension_type(type(first_item), storage_arr.type, registry=registry)
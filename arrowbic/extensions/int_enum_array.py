@@ -1,14 +1,50 @@
-from typing import Optional, Type, TypeVar
+import functools
+from enum import IntEnum
+from typing import Hashable, List, Optional, Tuple, Type, TypeVar, cast
+
+import numpy as np
 
 from arrowbic.core.base_extension_array import BaseExtensionArray
 from arrowbic.core.base_extension_type import BaseExtensionType
+from arrowbic.core.base_types import NdArrayGeneric
 
 TItem = TypeVar("TItem")
 
+_int_enum_lookup_max_size: int = 1 << 16
+"""Maximum IntEnum values range for which a members lookup table is used in bulk conversion.
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _make_int_enum_lookup_table(
+    item_pyclass: Type[IntEnum],
+) -> Optional[Tuple[int, NdArrayGeneric, NdArrayGeneric]]:
+    """Make (and cache) the lookup table raw value => IntEnum member of an IntEnum class.
+
+    Args:
+        item_pyclass: IntEnum Python class.
+    Returns:
+        Minimum IntEnum value, members table (with an additional None entry at the end for null values)
+        and boolean table of valid member entries. None if the IntEnum values range is too large.
+    """
+    values = [m.value for m in item_pyclass]
+    if len(values) == 0 or max(values) - min(values) >= _int_enum_lookup_max_size:
+        return None
+    value_min = min(values)
+    size = max(values) - value_min + 2
+    members = np.full(size, None, dtype=object)
+    is_valid_index = np.zeros(size, dtype=np.bool_)
+    for m in item_pyclass:
+        members[m.value - value_min] = m
+        is_valid_index[m.value - value_min] = True
+    return value_min, members, is_valid_index
+
 
 class IntEnumArray(BaseExtensionArray[TItem]):
     """IntEnum extension array."""
 
+    __slots__ = ()
+
     @classmethod
     def __arrowbic_ext_type_class__(cls) -> Type[BaseExtensionType]:
         from .int_enum_type import IntEnumType
@@ -23,7 +59,39 @@ class IntEnumArray(BaseExtensionArray[TItem]):
         Returns:
             Item (or None if null entry).
         """
-        item_pyclass = self.type.item_pyclass
+        item_pyclass = self.item_pyclass
         raw_value = self.storage[index].as_py()
-        value = item_pyclass(raw_value) if raw_value is not None else None
-        return value
+        if raw_value is None:
+            return None
+        try:
+            # Direct members lookup: skipping the IntEnum `__call__` machinery.
+            return item_pyclass._value2member_map_[raw_value]  # type:ignore
+        except KeyError:
+            return item_pyclass(raw_value)  # type:ignore
+
+    def to_pylist(self) -> List[Optional[TItem]]:
+        """Convert to a list of Python IntEnum items.
+
+        Raw values are converted in bulk, and then mapped to IntEnum members.
+        """
+        item_pyclass = self.item_pyclass
+        storage = self.storage
+        lookup = _make_int_enum_lookup_table(cast(Hashable, item_pyclass))
+        if lookup is not None and len(storage) > 0:
+            # Vectorized gather in the members lookup table (nulls mapped to the last None entry).
+            value_min, members, is_valid_index = lookup
+            null_index = len(members) - 1
+            raw_values_np = storage.fill_null(value_min).to_numpy(zero_copy_only=False)
+            indices = np.subtract(raw_values_np, value_min, dtype=np.int64)
+            if np.all((indices >= 0) & (indices < null_index)) and np.all(is_valid_index[indices]):
+                if storage.null_count > 0:
+                    indices[storage.is_null().to_numpy(zero_copy_only=False)] = null_index
+                return members[indices].tolist()
+
+        raw_values = storage.to_pylist()
+        value2member = item_pyclass._value2member_map_  # type:ignore
+        try:
+            return [value2member[v] if v is not None else None for v in raw_values]
+        except KeyError:
+            # Invalid raw value: IntEnum constructor raising the proper error.
+            return [item_pyclass(v) if v is not None else None for v in raw_values]  # type:ignore
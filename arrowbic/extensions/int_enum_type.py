@@ -1,8 +1,10 @@
 """IntEnum extension type in Arrowbic.
 """
+import functools
 from enum import IntEnum, unique
-from typing import Any, Dict, Iterable, Optional, Type, TypeVar
+from typing import Any, Dict, Hashable, Iterable, Optional, Type, TypeVar, cast
 
+import numpy as np
 import pyarrow as pa
 
 from arrowbic.core.base_extension_type import BaseExtensionType
@@ -35,12 +37,37 @@ def _check_int_enum_item_pyclass(item_pyclass: Optional[Type[Any]]) -> None:
     unique(item_pyclass)
 
 
+_int_enum_storage_types = (pa.int8(), pa.int16(), pa.int32(), pa.int64())
+"""Supported IntEnum storage types, by increasing size.
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _get_int_enum_storage_type(item_pyclass: Type[IntEnum]) -> pa.DataType:
+    """Get (and cache) the smallest signed integer storage type supporting all values of an IntEnum.
+
+    Args:
+        item_pyclass: IntEnum Python class.
+    Returns:
+        Arrow integer storage type.
+    """
+    values = [m.value for m in item_pyclass]
+    if len(values) == 0:
+        return pa.int64()
+    vmin, vmax = min(values), max(values)
+    for storage_type in _int_enum_storage_types:
+        iinfo = np.iinfo(storage_type.to_pandas_dtype())
+        if iinfo.min <= vmin and vmax <= iinfo.max:
+            return storage_type
+    raise ValueError(f"IntEnum values out of the int64 range: '{item_pyclass}'.")
+
+
 @register_extension_type
 class IntEnumType(BaseExtensionType):
     """IntEnum Arrowbic extension type.
 
     This extension type enables the support in Arrowbic of standard Python IntEnum,
-    storing the raw values directly at as a int64 array.
+    storing the raw values directly as a signed integer array (smallest type supporting all IntEnum values).
 
     Args:
         storage_type: Storage type to use for this instance.
@@ -49,6 +76,9 @@ class IntEnumType(BaseExtensionType):
         registry: Optional Arrowbic registry (global one by default).
     """
 
+    # No instance dictionary: all the extension type state is in the base class slots.
+    __slots__ = ()
+
     def __init__(
         self,
         storage_type: Optional[pa.DataType] = None,
@@ -58,9 +88,9 @@ class IntEnumType(BaseExtensionType):
         registry: Optional[ExtensionTypeRegistry] = None,
     ):
         super().__init__(storage_type, item_pyclass, package_name, registry=registry)
-        # Checking the storage type. TODO: make it valid with any integer type.
+        # Checking the storage type: any integer type is valid.
         # NOTE: PyArrow crashing if check before super().__init__(...)
-        is_valid_storage = self.storage_type == pa.null() or self.storage_type == pa.int64()
+        is_valid_storage = self.storage_type == pa.null() or pa.types.is_integer(self.storage_type)
         if not is_valid_storage:
             raise TypeError(f"Invalid Arrow storage type for an IntEnum extension type: {self.storage_type}.")
         _check_int_enum_item_pyclass(item_pyclass)
@@ -128,15 +158,15 @@ class IntEnumType(BaseExtensionType):
             Extension array, with the proper data.
         """
         consumed_size, first_item, it_items = first_valid_item_in_iterable(it_items)
-        if it_items is None:
+        if first_item is None:
             size = min(size, consumed_size) if size is not None else consumed_size
             return pa.nulls(size)
 
         item_pyclass = type(first_item)
-        # TODO: choose optimal integer storage depending on IntEnum definition.
-        storage_type = pa.int64()
+        # Smallest integer storage depending on IntEnum definition.
+        storage_type = _get_int_enum_storage_type(cast(Hashable, item_pyclass))
         ext_enum_type = find_registry_extension_type(item_pyclass, storage_type, registry=registry)
         # Build the IntEnum array.
-        storage_arr = pa.array(it_items, size=size)
+        storage_arr = pa.array(it_items, type=storage_type, size=size)
         arr = IntEnumArray.from_storage(ext_enum_type, storage_arr)
         return arr
@@ -1,6 +1,9 @@
 """NdArray/Tensor array extension in Arrowbic.
 """
-from typing import Iterable, Optional, Type, TypeVar
+import functools
+import itertools
+import operator
+from typing import Iterable, List, Optional, Tuple, Type, TypeVar
 
 import numpy as np
 import pyarrow as pa
@@ -17,6 +20,8 @@ TArray = TypeVar("TArray", bound="TensorArray")
 class TensorArray(BaseExtensionArray[NdArrayGeneric]):
     """NdArray/Tensor extension array."""
 
+    __slots__ = ("_raw_numpy_cache",)
+
     @classmethod
     def __arrowbic_ext_type_class__(cls) -> Type[BaseExtensionType]:
         from .tensor_type import TensorType
@@ -30,19 +35,66 @@ class TensorArray(BaseExtensionArray[NdArrayGeneric]):
             index: Index of the item to retrieve.
         Returns:
             Item (or None if null entry).
+        Raises:
+            IndexError: if the index is out of bounds.
         """
-        raw_data = self.storage.field(0)[index]
-        if not raw_data.is_valid:
+        size = len(self)
+        if not -size <= index < size:
+            raise IndexError(f"Index {index} out of bounds for tensor array of size {size}.")
+        if index < 0:
+            index += size
+        storage = self.storage
+        # No struct scalar allocated to check validity when there are no nulls at all.
+        if storage.null_count > 0 and not storage[index].is_valid:
             return None
 
-        # Slicing directly the raw Numpy data.
-        raw_values = self.storage.field(0).values.to_numpy(zero_copy_only=True)
-        raw_offsets = self.storage.field(0).offsets.to_numpy(zero_copy_only=True)
+        raw_values, raw_offsets, raw_shapes, raw_shape_offsets = self._raw_numpy_arrays
 
-        shape = self.storage.field(1)[index].as_py()
+        # Slicing directly the (cached) raw Numpy data.
+        shape = tuple(raw_shapes[raw_shape_offsets[index] : raw_shape_offsets[index + 1]])
         data = raw_values[raw_offsets[index] : raw_offsets[index + 1]].reshape(shape)
         return data
 
+    def to_pylist(self) -> List[Optional[NdArrayGeneric]]:
+        """Convert to a list of Numpy arrays.
+
+        Validity is read once for the whole array, and items are directly sliced from the raw Numpy data.
+        """
+        storage = self.storage
+        size = len(storage)
+        if storage.null_count == size:
+            return [None] * size
+        validity = storage.is_valid().to_pylist() if storage.null_count > 0 else itertools.repeat(True, size)
+        raw_values, raw_offsets, raw_shapes, raw_shape_offsets = self._raw_numpy_arrays
+        return [
+            raw_values[raw_offsets[idx] : raw_offsets[idx + 1]].reshape(
+                tuple(raw_shapes[raw_shape_offsets[idx] : raw_shape_offsets[idx + 1]])
+            )
+            if is_valid
+            else None
+            for idx, is_valid in enumerate(validity)
+        ]
+
+    @property
+    def _raw_numpy_arrays(self) -> Tuple[NdArrayGeneric, NdArrayGeneric, NdArrayGeneric, NdArrayGeneric]:
+        """Numpy arrays of the data values & offsets, shape values & offsets (zero-copy, except boolean data).
+
+        Cached on the instance: avoiding Numpy conversions at every item access.
+        """
+        try:
+            return _raw_numpy_cache_slot.__get__(self)
+        except AttributeError:
+            data_arr = self.storage.field(0)
+            shape_arr = self.storage.field(1)
+            raw_arrays = (
+                data_arr.values.to_numpy(zero_copy_only=False),
+                data_arr.offsets.to_numpy(zero_copy_only=True),
+                shape_arr.values.to_numpy(zero_copy_only=True),
+                shape_arr.offsets.to_numpy(zero_copy_only=True),
+            )
+            self._raw_numpy_cache = raw_arrays
+            return raw_arrays
+
     @classmethod
     def make_from_data_shape_arrays(
         cls: Type[TArray],
@@ -102,11 +154,21 @@ class TensorArray(BaseExtensionArray[NdArrayGeneric]):
 
         N = arr.shape[0]
         item_shape = arr.shape[1:]
-        item_size = np.prod(item_shape)
-        # Data array.
+        # NOTE: `math.prod` only available from Python 3.8.
+        item_size = functools.reduce(operator.mul, item_shape, 1)
+        if N * item_size > np.iinfo(np.int32).max:
+            raise ValueError(f"Input Numpy array too large to be stored in a tensor array: '{arr.shape}'.")
+        # Data array: zero-copy on C-contiguous inputs, with list offsets directly in Arrow format (int32).
         data_values = pa.array(np.ravel(arr))
-        data_offsets = pa.array(np.arange(0, N * item_size + 1, item_size, dtype=np.int64))
+        data_offsets = pa.array(np.arange(N + 1, dtype=np.int32) * np.int32(item_size))
         data_arr = pa.ListArray.from_arrays(data_offsets, data_values)
-        # Shape array.
-        shape_arr = pa.array([item_shape] * N)
+        # Shape array: same shape for all items, built directly from Numpy (no Python list per item).
+        # NOTE: keeping a variable size list type, for consistency with the generic tensor array storage.
+        ndim = len(item_shape)
+        shape_values = pa.array(np.tile(np.asarray(item_shape, dtype=np.int64), N))
+        shape_offsets = pa.array(np.arange(N + 1, dtype=np.int32) * np.int32(ndim))
+        shape_arr = pa.ListArray.from_arrays(shape_offsets, shape_values)
         return cls.make_from_data_shape_arrays(data_arr, shape_arr)
+
+
+_raw_numpy_cache_slot = TensorArray._raw_numpy_cache  # type:ignore
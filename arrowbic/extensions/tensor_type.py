@@ -1,6 +1,5 @@
 """NdArray/Tensor extension type in Arrowbic.
 """
-import itertools
 from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
 
 import numpy as np
@@ -8,6 +7,7 @@ import pyarrow as pa
 
 from arrowbic.core.base_extension_type import BaseExtensionType
 from arrowbic.core.extension_type_registry import ExtensionTypeRegistry, register_extension_type, register_item_pyclass
+from arrowbic.core.utils import first_items_in_iterable
 
 from .tensor_array import NdArrayGeneric, TensorArray
 
@@ -33,6 +33,37 @@ def _check_tensor_storage_type(storage_type: pa.DataType) -> None:
         raise TypeError(f"The second field of tensor storage type should be 'shape', not '{storage_type[1]}'.")
 
 
+def _make_ragged_data_array(arrays: List[Optional[NdArrayGeneric]], mask: List[bool]) -> pa.Array:
+    """Make the Arrow (list) data array of a tensor array from flat Numpy arrays.
+
+    Flat arrays sharing the same dtype are concatenated in a single contiguous Numpy buffer, converted in one go
+    to Arrow, instead of letting PyArrow convert every Numpy array independently.
+
+    Args:
+        arrays: Flat Numpy arrays (None for null entries).
+        mask: Null entries mask.
+    Returns:
+        Arrow list array of the data.
+    """
+    valid_arrays = [v for v in arrays if v is not None]
+    if len(valid_arrays) == 0 or valid_arrays[0].dtype.kind == "O":
+        # Nothing to concatenate, or generic Python objects: PyArrow direct conversion.
+        return pa.array(arrays)
+    dtype = valid_arrays[0].dtype
+    if any(v.dtype != dtype for v in valid_arrays):
+        # Mixed dtypes: no silent Numpy promotion, PyArrow conversion rules (and errors) instead.
+        return pa.array(arrays)
+
+    values = np.concatenate(valid_arrays)
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([v.size if v is not None else 0 for v in arrays], out=offsets[1:])
+    if offsets[-1] > np.iinfo(np.int32).max:
+        raise ValueError("Tensor data too large to be stored in a tensor array.")
+    # Null offsets corresponding to null entries.
+    offsets_arr = pa.array(offsets.astype(np.int32), mask=np.array(mask + [False], dtype=np.bool_))
+    return pa.ListArray.from_arrays(offsets_arr, pa.array(values))
+
+
 @register_extension_type
 class TensorType(BaseExtensionType):
     """NdArray/Tensor extension type.
@@ -44,6 +75,9 @@ class TensorType(BaseExtensionType):
         registry: Optional Arrowbic registry (global one by default).
     """
 
+    # No instance dictionary: all the extension type state is in the base class slots.
+    __slots__ = ()
+
     def __init__(
         self,
         storage_type: Optional[pa.DataType] = None,
@@ -107,8 +141,7 @@ class TensorType(BaseExtensionType):
         Returns:
             Extension array, with the proper data.
         """
-        if size is not None:
-            it_items = itertools.islice(it_items, size)
+        it_items = first_items_in_iterable(it_items, size)
 
         # Manually gathering the `data` and `shape` columns.
         arrays: List[Optional[NdArrayGeneric]] = []
@@ -120,14 +153,14 @@ class TensorType(BaseExtensionType):
                 shapes.append([])
                 mask.append(True)
             else:
-                x = np.asarray(v)
-                arrays.append(np.ravel(x))
+                x = v if isinstance(v, np.ndarray) else np.asarray(v)
+                arrays.append(x.reshape(-1))
                 shapes.append(x.shape)
                 mask.append(False)
         # Build the raw Arrow columns + struct storage.
-        data_arr = pa.array(arrays)
+        data_arr = _make_ragged_data_array(arrays, mask)
         shape_arr = pa.array(shapes, type=pa.list_(pa.int64(), -1))
-        mask_arr = pa.array(mask, type=pa.bool_())
+        mask_arr = pa.array(mask, type=pa.bool_()) if any(mask) else None
         return TensorArray.make_from_data_shape_arrays(data_arr, shape_arr, mask=mask_arr, registry=registry)
 
 
@@ -0,0 +1,27 @@
+import os
+from typing import Iterator
+
+# Test session allocator: jemalloc returning freed memory to the OS right away (set before any PyArrow import),
+# i.e. stable resident memory over the many array builds of the test suite.
+os.environ.setdefault("ARROW_DEFAULT_MEMORY_POOL", "jemalloc")
+os.environ.setdefault("MALLOC_CONF", "dirty_decay_ms:0,muzzy_decay_ms:0")
+
+import pyarrow as pa  # noqa: E402
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def arrow_jemalloc_decay() -> None:
+    """Immediate release of the freed jemalloc pages (no-op when PyArrow is built without jemalloc)."""
+    try:
+        pa.jemalloc_set_decay_ms(0)
+    except NotImplementedError:
+        pass
+
+
+@pytest.fixture
+def arrow_memory_released() -> Iterator[None]:
+    """Check a test releases all the Arrow memory it allocated (i.e. no Arrow buffer leaked in caches)."""
+    allocated_bytes = pa.total_allocated_bytes()
+    yield
+    assert pa.total_allocated_bytes() <= allocated_bytes
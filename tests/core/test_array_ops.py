@@ -1,4 +1,7 @@
+import array
+import dataclasses
 import unittest
+import unittest.mock
 from enum import IntEnum
 
 import numpy as np
@@ -8,7 +11,8 @@ from arrowbic.core.array_ops import array as ab_array
 from arrowbic.core.array_ops import asarray as ab_asarray
 from arrowbic.core.array_ops import get_pyitem
 from arrowbic.core.extension_type_registry import register_item_pyclass, unregister_item_pyclass
-from arrowbic.extensions import IntEnumArray
+from arrowbic.core.utils import items_to_columns
+from arrowbic.extensions import DataclassArray, IntEnumArray, TensorArray
 
 
 class DummyIntEnum(IntEnum):
@@ -16,12 +20,20 @@ class DummyIntEnum(IntEnum):
     Valid = 2
 
 
+@dataclasses.dataclass
+class DummyData:
+    index: int
+    name: str
+
+
 class TestArrowbicArraysOps(unittest.TestCase):
     def setUp(self) -> None:
         register_item_pyclass(DummyIntEnum)
+        register_item_pyclass(DummyData)
 
     def tearDown(self) -> None:
         unregister_item_pyclass(DummyIntEnum)
+        unregister_item_pyclass(DummyData)
 
     def test__array__int_list_input__proper_array(self) -> None:
         arr = ab_array([1, 2, None, 4])
@@ -35,11 +47,41 @@ class TestArrowbicArraysOps(unittest.TestCase):
         assert len(arr) == 3
         assert arr.to_pylist() == [None, 2, None]
 
+    def test__array__dataclass_list_input__no_items_copy(self) -> None:
+        items = [None, DummyData(1, "a"), DummyData(2, "b")]
+        with unittest.mock.patch(
+            "arrowbic.extensions.dataclass_type.items_to_columns", wraps=items_to_columns
+        ) as items_to_columns_mock:
+            arr = ab_array(items)
+        assert isinstance(arr, DataclassArray)
+        assert arr.to_pylist() == items
+        # The input list is directly used by the dataclass builder (no islice wrapping or copy).
+        assert items_to_columns_mock.call_args[0][0] is items
+
     def test__array__numpy_input__proper_array(self) -> None:
         arr: pa.Int64Array = ab_array(np.array([1, 2, 3, 4]))
         assert isinstance(arr, pa.Int64Array)
         assert len(arr) == 4
 
+    def test__array__numpy_input_with_size__proper_array(self) -> None:
+        values = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+        arr = ab_array(values, size=3)
+        assert isinstance(arr, pa.FloatArray)
+        assert arr.to_pylist() == [1.0, 2.0, 3.0]
+
+    def test__array__buffer_protocol_input__proper_array(self) -> None:
+        arr = ab_array(array.array("q", [1, 2, 3]))
+        assert isinstance(arr, pa.Int64Array)
+        assert arr.to_pylist() == [1, 2, 3]
+
+    def test__array__numpy_object_array_of_arrays__tensor_array(self) -> None:
+        values = np.array([None, np.zeros(3), np.ones(2)], dtype=object)
+        arr = ab_array(values)
+        assert isinstance(arr, TensorArray)
+        assert len(arr) == 3
+        assert arr[0] is None
+        np.testing.assert_array_equal(arr[2], np.ones(2))
+
     def test__array__int_enum_input__proper_array(self) -> None:
         values = [DummyIntEnum.Invalid, None, DummyIntEnum.Valid]
         arr = ab_array(values)
@@ -61,6 +103,10 @@ class TestArrowbicArraysOps(unittest.TestCase):
         assert isinstance(arr_out, IntEnumArray)
         assert arr_out is arr_in
 
+    def test__asarray__pyarrow_chunked_array__noop(self) -> None:
+        arr_in = pa.chunked_array([[1, 2], [3]])
+        assert ab_asarray(arr_in) is arr_in
+
     def test__get_pyitem__pyarrow_simple_array__proper_value(self) -> None:
         arr = pa.array([None, 10, 3, None, 5])
         assert isinstance(get_pyitem(arr, 1), int)
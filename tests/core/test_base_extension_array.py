@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+import numpy.testing as npt
 import pyarrow as pa
 
 from .test_base_extension_type import DummyData, DummyExtensionArray, DummyExtensionType
@@ -21,3 +23,44 @@ class TestBaseExtensionArray(unittest.TestCase):
         assert isinstance(arr, DummyExtensionArray)
         assert len(arr) == 3
         assert list(arr) == [DummyData(1), DummyData(2), DummyData(3)]
+
+    def test__base_extension_array__iter__multiple_chunks(self) -> None:
+        values = [DummyData(idx) for idx in range(10000)]
+        arr = DummyExtensionArray.from_iterator(values)
+        assert list(arr) == values
+
+    def test__base_extension_array__getitem__slicing(self) -> None:
+        values = [DummyData(idx) for idx in range(6)]
+        arr = DummyExtensionArray.from_iterator(values)
+
+        arr_slice = arr[1:4]
+        assert isinstance(arr_slice, DummyExtensionArray)
+        assert arr_slice.type == arr.type
+        assert list(arr_slice) == values[1:4]
+        assert list(arr[4:1]) == []
+        assert list(arr[::2]) == values[::2]
+        assert list(arr[::-1]) == values[::-1]
+
+    def test__base_extension_array__storage__cached_array(self) -> None:
+        arr = DummyExtensionArray.from_iterator([DummyData(1), DummyData(2)])
+        assert arr.storage is arr.storage
+        assert arr.storage.to_pylist() == [1, 2]
+
+    def test__base_extension_array__to_numpy_view__zero_copy(self) -> None:
+        arr = DummyExtensionArray.from_iterator([DummyData(idx) for idx in range(5)])[1:]
+        values = arr.to_numpy_view()
+
+        assert values.dtype == np.int64
+        assert not values.flags.writeable
+        npt.assert_array_equal(values, [1, 2, 3, 4])
+
+    def test__base_extension_array__to_numpy_view__with_nulls(self) -> None:
+        ext_type = DummyExtensionType(pa.float32(), DummyData)
+        arr = DummyExtensionArray.from_storage(ext_type, pa.array([1.0, None, 3.0], type=pa.float32()))
+        values = arr.to_numpy_view()
+        npt.assert_array_equal(values, [1.0, np.nan, 3.0])
+
+    def test__base_extension_array__item_pyclass__cached(self) -> None:
+        arr = DummyExtensionArray.from_iterator([DummyData(1), DummyData(2)])
+        assert arr.item_pyclass is arr.type.item_pyclass
+        assert arr.item_pyclass is DummyData
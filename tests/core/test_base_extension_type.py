@@ -1,8 +1,9 @@
 import copy
+import itertools
 import json
 import unittest
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Type, TypeVar
+from typing import Any, Iterable, List, Optional, Type, TypeVar
 
 import pyarrow as pa
 
@@ -29,9 +30,12 @@ class DummyExtensionType(BaseExtensionType):
     def __arrowbic_from_item_iterator__(
         cls, it_items: Iterable[Optional[TItem]], size: Optional[int] = None, registry: Optional[Any] = None
     ) -> "DummyExtensionArray":
+        if size is not None:
+            it_items = itertools.islice(it_items, size)
         values = [item.v if isinstance(item, DummyData) else None for item in it_items]
         ext_type = DummyExtensionType(pa.int64(), DummyData)
-        return pa.ExtensionArray.from_storage(ext_type, pa.array(values))
+        # Explicit storage type: no PyArrow type inference.
+        return pa.ExtensionArray.from_storage(ext_type, pa.array(values, type=pa.int64()))
 
 
 class DummyExtensionArray(BaseExtensionArray[DummyData]):
@@ -42,10 +46,15 @@ class DummyExtensionArray(BaseExtensionArray[DummyData]):
     def __arrowbic_getitem__(self, index: int) -> Optional[DummyData]:
         return DummyData(self.storage[index].as_py())
 
+    def to_pylist(self) -> List[Optional[DummyData]]:
+        # Bulk conversion of the storage, no scalar per item.
+        return [DummyData(v) for v in self.storage.to_pylist()]
+
 
 def test__make_extension_name__proper_result() -> None:
     name = make_extension_name("MyExtension", "package")
     assert name == "arrowbic.package.MyExtension"
+    assert make_extension_name("MyExtension", "package") is name
 
 
 class TestBaseExtensionType(unittest.TestCase):
@@ -92,3 +101,8 @@ class TestBaseExtensionType(unittest.TestCase):
         ext_metadata = ext_type.__arrowbic_ext_metadata__()
         ext_serialized = ext_type.__arrow_ext_serialize__()
         assert json.loads(ext_serialized.decode()) == ext_metadata
+
+    def test__base_extension_type__arrow_ext_serialize__cached_result(self) -> None:
+        ext_type = DummyExtensionType(pa.float32(), DummyData, "MyPackage")
+        ext_serialized = ext_type.__arrow_ext_serialize__()
+        assert ext_type.__arrow_ext_serialize__() is ext_serialized
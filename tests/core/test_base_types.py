@@ -15,6 +15,12 @@ def test__is_supported_base_type__proper_result() -> None:
     assert not is_supported_base_type(arrowbic.extensions.IntEnumType())
     assert not is_supported_base_type(arrowbic.extensions.TensorType())
 
+    assert is_supported_base_type(pa.int32())
+    assert is_supported_base_type(pa.utf8())
+    assert is_supported_base_type(pa.timestamp("ms"))
+    assert not is_supported_base_type(pa.timestamp("ms", tz="UTC"))
+    assert not is_supported_base_type(pa.binary(3))
+
 
 def test__from_numpy_to_arrow_type__np_dtype__proper_coverage() -> None:
     assert from_numpy_to_arrow_type(None) == pa.null()
@@ -34,6 +40,16 @@ def test__from_numpy_to_arrow_type__np_dtype__proper_coverage() -> None:
         from_numpy_to_arrow_type(np.dtype("O"))
 
 
+def test__from_numpy_to_arrow_type__base_pyclass_lookup() -> None:
+    assert from_numpy_to_arrow_type(bool) == pa.bool_()
+    assert from_numpy_to_arrow_type(int) == pa.int64()
+    assert from_numpy_to_arrow_type(float) == pa.float64()
+    assert from_numpy_to_arrow_type(str) == pa.string()
+    assert from_numpy_to_arrow_type(bytes) == pa.binary()
+    assert from_numpy_to_arrow_type(np.uint16) == pa.uint16()
+    assert from_numpy_to_arrow_type(np.str_) == pa.string()
+
+
 def test__from_numpy_to_arrow_type__python_class__proper_coverage() -> None:
     assert from_numpy_to_arrow_type(None) == pa.null()
     assert from_numpy_to_arrow_type(type(None)) == pa.null()
@@ -62,6 +78,14 @@ def test__from_arrow_to_numpy_dtype__proper_coverage() -> None:
     assert from_arrow_to_numpy_dtype(pa.duration("ns")) == np.dtype("timedelta64[ns]")
 
 
+def test__from_arrow_to_numpy_dtype__memoized_parametric_types() -> None:
+    # Same type id, different time units (and timezone).
+    assert from_arrow_to_numpy_dtype(pa.timestamp("s")) == np.dtype("datetime64[s]")
+    assert from_arrow_to_numpy_dtype(pa.timestamp("ms", tz="UTC")) == np.dtype("datetime64[ms]")
+    assert from_arrow_to_numpy_dtype(pa.timestamp("s")) == np.dtype("datetime64[s]")
+    assert from_arrow_to_numpy_dtype(pa.list_(pa.int32())) == np.dtype("O")
+
+
 def test__from_arrow_to_python_class__proper_coverage() -> None:
     assert from_arrow_to_python_class(pa.null()) == type(None)  # noqa: E721
     assert from_arrow_to_python_class(pa.float32()) == float  # noqa: E721
@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock
 from typing import Type, TypeVar
 
 import pyarrow as pa
@@ -7,6 +8,7 @@ from arrowbic.core.base_extension_type import BaseExtensionType
 from arrowbic.core.extension_type_registry import (
     ExtensionTypeRegistry,
     find_registry_extension_type,
+    find_registry_extension_type_or_none,
     register_extension_type,
     register_item_pyclass,
 )
@@ -107,6 +109,17 @@ class TestExtensionTypeRegistryBase(unittest.TestCase):
         ext_type = registry.find_extension_type(DummyData)
         assert ext_type is root_extension_type
 
+    def test__ext_type_registry__find_root_extension_type_or_none__proper_result(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+        assert registry.find_root_extension_type_or_none(DummyData) is None
+
+        registry.register_item_pyclass(DummyData)
+        assert registry.find_root_extension_type_or_none(DummyData) is root_extension_type
+        registry.unregister_item_pyclass(DummyData)
+        assert registry.find_root_extension_type_or_none(DummyData) is None
+
     def test__ext_type_registry__find_extension_type__with_storage_type(self) -> None:
         registry = ExtensionTypeRegistry()
         root_extension_type = DummyExtensionType(None, None, None)
@@ -127,6 +140,76 @@ class TestExtensionTypeRegistryBase(unittest.TestCase):
         ext_type1 = registry.find_extension_type(DummyData, pa.float32())
         assert ext_type1 is ext_type0
 
+    def test__ext_type_registry__find_extension_type__identity_and_equal_storage_types(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+        registry.register_item_pyclass(DummyData)
+
+        storage_type = pa.list_(pa.int64(), 3)
+        ext_type0 = registry.find_extension_type(DummyData, storage_type)
+        ext_type1 = registry.find_extension_type(DummyData, storage_type)
+        # Equal but distinct storage type object: same cached extension type.
+        ext_type2 = registry.find_extension_type(DummyData, pa.list_(pa.int64(), 3))
+        assert ext_type1 is ext_type0
+        assert ext_type2 is ext_type0
+        assert (DummyData, id(storage_type)) in registry._item_pyclasses_identity_cache
+
+    def test__ext_type_registry__find_extension_type__bounded_cache(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+        registry.register_item_pyclass(DummyData)
+
+        with unittest.mock.patch("arrowbic.core.extension_type_registry._extension_types_cache_maxsize", 4):
+            for size in range(1, 10):
+                ext_type = registry.find_extension_type(DummyData, pa.list_(pa.int64(), size))
+                assert ext_type.storage_type == pa.list_(pa.int64(), size)
+            assert len(registry._item_pyclasses_cache) <= 4
+            assert len(registry._item_pyclasses_identity_cache) <= 4
+            # Root extension type still properly returned once evicted from the cache.
+            assert registry.find_extension_type(DummyData) is root_extension_type
+            assert registry.find_extension_type(DummyData, pa.null()) is root_extension_type
+
+    def test__ext_type_registry__find_extension_type__unregistered_item_pyclass(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+        registry.register_item_pyclass(DummyData)
+        registry.find_extension_type(DummyData, pa.float32())
+        registry.unregister_item_pyclass(DummyData)
+
+        with self.assertRaises(KeyError):
+            registry.find_extension_type(DummyData)
+        with self.assertRaises(KeyError):
+            registry.find_extension_type(DummyData, pa.float32())
+
+    def test__ext_type_registry__register_item_pyclass__after_unregister(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+        registry.register_item_pyclass(DummyData)
+        registry.unregister_item_pyclass(DummyData)
+
+        assert registry.register_item_pyclass(DummyData) is root_extension_type
+        assert registry.find_extension_type(DummyData) is root_extension_type
+
+    def test__ext_type_registry__clone__independent_copy(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+        registry.register_item_pyclass(DummyData)
+        ext_type = registry.find_extension_type(DummyData, pa.float32())
+
+        clone = registry.clone()
+        assert clone.root_extension_types == registry.root_extension_types
+        assert clone.find_extension_type(DummyData, pa.float32()) is ext_type
+        # Unregistering in the clone does not modify the original registry.
+        clone.unregister_item_pyclass(DummyData)
+        assert registry.find_extension_type(DummyData) is root_extension_type
+        with self.assertRaises(KeyError):
+            clone.find_extension_type(DummyData)
+
     def test__register_item_pyclass__decorator_properly_working(self) -> None:
         registry = ExtensionTypeRegistry()
         root_extension_type = DummyExtensionType(None, None, None)
@@ -157,3 +240,12 @@ class TestExtensionTypeRegistryBase(unittest.TestCase):
 
         ext_type = find_registry_extension_type(DummyData, registry=registry)
         assert ext_type is root_extension_type
+
+    def test__find_registry_extension_type_or_none__proper_result(self) -> None:
+        registry = ExtensionTypeRegistry()
+        root_extension_type = DummyExtensionType(None, None, None)
+        registry.register_root_extension_type(root_extension_type)
+
+        assert find_registry_extension_type_or_none(DummyData, registry=registry) is None
+        registry.register_item_pyclass(DummyData)
+        assert find_registry_extension_type_or_none(DummyData, registry=registry) is root_extension_type
@@ -1,6 +1,18 @@
+import collections
+from dataclasses import dataclass
+from typing import Any
+
 import immutables
+import numpy as np
+import pytest
+
+from arrowbic.core.utils import as_immutable, first_items_in_iterable, first_valid_item_in_iterable, items_to_columns
+
 
-from arrowbic.core.utils import as_immutable, first_valid_item_in_iterable
+@dataclass
+class DummyItem:
+    a: int
+    b: str
 
 
 def test__first_valid_item_in_iterable__list__proper_result() -> None:
@@ -11,6 +23,16 @@ def test__first_valid_item_in_iterable__list__proper_result() -> None:
     assert it is values
 
 
+@pytest.mark.parametrize(
+    "values,expected",
+    [([], (0, None)), ((None, None), (2, None)), ((0, None), (0, 0)), ([None, None, False], (2, False))],
+)
+def test__first_valid_item_in_iterable__list_tuple__edge_cases(values: Any, expected: Any) -> None:
+    num, item, it = first_valid_item_in_iterable(values)
+    assert (num, item) == expected
+    assert it is values
+
+
 def test__first_valid_item_in_iterable__iterator__proper_result() -> None:
     values = [None, 3, 2, None, 3]
     num, item, it = first_valid_item_in_iterable(iter(values))
@@ -19,6 +41,39 @@ def test__first_valid_item_in_iterable__iterator__proper_result() -> None:
     assert list(it) == values
 
 
+def test__first_valid_item_in_iterable__numpy_object_array__proper_result() -> None:
+    values = np.array([None, None, "a", None], dtype=object)
+    num, item, it = first_valid_item_in_iterable(values)
+    assert num == 2
+    assert item == "a"
+    assert it is values
+
+
+def test__first_valid_item_in_iterable__numpy_object_array_of_arrays() -> None:
+    # Identity check on items: no ambiguous Numpy arrays comparison.
+    values = np.array([None, np.zeros(3), np.ones(2)], dtype=object)
+    num, item, it = first_valid_item_in_iterable(values)
+    assert num == 1
+    assert item is values[1]
+    assert it is values
+
+
+def test__first_valid_item_in_iterable__numpy_numeric_array__proper_result() -> None:
+    values = np.array([3, 2, 1])
+    num, item, it = first_valid_item_in_iterable(values)
+    assert num == 0
+    assert item == 3
+    assert it is values
+
+
+def test__first_valid_item_in_iterable__random_access_iterable__no_copy() -> None:
+    values = collections.deque([None, None, 2])
+    num, item, it = first_valid_item_in_iterable(values)
+    assert num == 2
+    assert item == 2
+    assert it is values
+
+
 def test__first_valid_item_in_iterable__none_iterator() -> None:
     values = [None, None, None]
     num, item, it = first_valid_item_in_iterable(iter(values))
@@ -27,6 +82,28 @@ def test__first_valid_item_in_iterable__none_iterator() -> None:
     assert it == values
 
 
+def test__first_items_in_iterable__sequence_and_iterator() -> None:
+    values = [1, None, 3]
+    assert first_items_in_iterable(values, None) is values
+    assert first_items_in_iterable(values, 3) is values
+    assert first_items_in_iterable(values, 5) is values
+    assert first_items_in_iterable(values, 2) == [1, None]
+    assert first_items_in_iterable(tuple(values), 1) == (1,)
+    assert list(first_items_in_iterable(iter(values), 2)) == [1, None]
+
+
+def test__items_to_columns__proper_result() -> None:
+    items = [DummyItem(1, "1"), None, DummyItem(3, "3")]
+    assert items_to_columns(items, ["a", "b"]) == ([1, None, 3], ["1", None, "3"])
+    assert items_to_columns(iter(items), ["b"]) == (["1", None, "3"],)
+    assert items_to_columns(items, []) == ()
+
+
+def test__items_to_columns__invalid_field_name() -> None:
+    with pytest.raises(ValueError):
+        items_to_columns([DummyItem(1, "1")], ["a.real"])
+
+
 def test__as_immutable__base_types() -> None:
     assert as_immutable(123) == 123
     assert as_immutable(12.3) == 12.3
@@ -42,3 +119,8 @@ def test__as_immutable__list_input() -> None:
 
 def test__as_immutable__dict_input() -> None:
     assert as_immutable({1: "1", 2: "2"}) == immutables.Map({1: "1", 2: "2"})
+
+
+def test__as_immutable__subclass_input() -> None:
+    assert as_immutable(collections.OrderedDict([(1, [2])])) == immutables.Map({1: (2,)})
+    assert as_immutable(True) is True
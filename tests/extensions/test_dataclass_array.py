@@ -1,11 +1,13 @@
-import copy
+import dataclasses
+import sys
 import unittest
 
 import numpy as np
 import numpy.testing as npt
 import pyarrow as pa
+import pytest
 
-from arrowbic.core.extension_type_registry import _global_registry
+from arrowbic.core.extension_type_registry import ExtensionTypeRegistry, _global_registry
 from arrowbic.extensions import DataclassArray
 from arrowbic.extensions.tensor_array import TensorArray
 
@@ -13,11 +15,18 @@ from .test_dataclass_type import DummyData, DummyIntEnum
 
 
 class TestDataclassArray(unittest.TestCase):
+    base_registry: ExtensionTypeRegistry
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Start from the default global registry, registering the test classes once.
+        cls.base_registry = _global_registry.clone()
+        cls.base_registry.register_item_pyclass(DummyIntEnum)
+        cls.base_registry.register_item_pyclass(DummyData)
+
     def setUp(self) -> None:
-        # Start from the default global registry.
-        self.registry = copy.deepcopy(_global_registry)
-        self.registry.register_item_pyclass(DummyIntEnum)
-        self.registry.register_item_pyclass(DummyData)
+        # Cheap per-test copy: tests are free to modify their registry.
+        self.registry = self.base_registry.clone()
 
     def test__dataclass_array__get_item__none_element(self) -> None:
         items = [
@@ -46,6 +55,122 @@ class TestDataclassArray(unittest.TestCase):
         assert arr[1].data is not None
         npt.assert_array_equal(arr[1].data, items[1].data)  # type:ignore
 
+    def test__dataclass_array__children__cached(self) -> None:
+        items = [DummyData(DummyIntEnum.Valid, None, 3.0, "name2")]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+
+        assert arr.name is arr.name
+        assert arr.name.to_pylist() == ["name2"]
+        assert arr[0] == items[0]
+
+    def test__dataclass_array__to_pylist__proper_result(self) -> None:
+        items = [
+            None,
+            DummyData(DummyIntEnum.Invalid, None, None, "name0"),
+            DummyData(DummyIntEnum.Valid, None, 3.0, "name2"),
+        ]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        values = arr.to_pylist()
+
+        assert values == items
+        # Consistent with single item access.
+        assert arr[1:].to_pylist() == [arr[1], arr[2]]
+
+    @unittest.skipIf(sys.version_info < (3, 10), "Dataclass `kw_only` requires Python 3.10.")
+    def test__dataclass_array__to_pylist__kw_only_dataclass(self) -> None:
+        @dataclasses.dataclass(kw_only=True)
+        class DummyKwOnlyData:
+            score: float
+            name: str
+
+        self.registry.register_item_pyclass(DummyKwOnlyData)
+        items = [DummyKwOnlyData(score=1.0, name="name0"), None]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        assert arr.to_pylist() == items
+        assert list(arr) == items
+        assert arr[0] == items[0]
+
+    def test__dataclass_array__from_iterator__no_validity_bitmap_without_nulls(self) -> None:
+        items = [DummyData(DummyIntEnum.Valid, None, 3.0, "name2")]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        assert arr.storage.null_count == 0
+        assert arr.storage.buffers()[0] is None
+
+    def test__dataclass_array__from_field_arrays__mask_and_keys_check(self) -> None:
+        columns = {"type": pa.array([1, 2]), "data": pa.nulls(2), "score": np.array([1.0, 2.0]), "name": ["a", "b"]}
+        arr = DataclassArray.from_field_arrays(DummyData, columns, mask=[True, False], registry=self.registry)
+        assert arr.null_count == 1
+        assert arr.type.item_pyclass is DummyData
+        assert arr.storage.field(2).equals(pa.array([1.0, 2.0], type=pa.float64()))
+
+        with self.assertRaises(KeyError):
+            DataclassArray.from_field_arrays(DummyData, {"type": pa.array([1, 2])}, registry=self.registry)
+
+    def test__dataclass_array__from_field_arrays__chunked_columns(self) -> None:
+        columns = {
+            "type": pa.chunked_array([[1], [2]]),
+            "data": pa.nulls(2),
+            "score": pa.chunked_array([[1.0], [2.0]]),
+            "name": ["a", "b"],
+        }
+        arr = DataclassArray.from_field_arrays(DummyData, columns, registry=self.registry)
+        assert len(arr) == 2
+        assert arr.storage.field(0).equals(pa.array([1, 2]))
+        assert arr.storage.field(2).equals(pa.array([1.0, 2.0]))
+
+    @pytest.mark.usefixtures("arrow_memory_released")
+    def test__dataclass_array__from_iterator__memory_released(self) -> None:
+        items = [DummyData(DummyIntEnum.Valid, np.arange(100), float(idx), f"name{idx}") for idx in range(100)]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        # Fill the array caches before releasing the array.
+        item = arr.to_pylist()[1]
+        assert item is not None and item.score == 1.0
+        npt.assert_array_equal(arr.data[1], np.arange(100))
+        del arr
+
+    def test__dataclass_array__to_pylist__storage_fields_reordered(self) -> None:
+        items = [DummyData(DummyIntEnum.Valid, None, 3.0, "name2")]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        storage = arr.storage
+        keys = arr.keys()[::-1]
+        storage_rev = pa.StructArray.from_arrays([storage.field(k) for k in keys], keys)
+        arr_rev = DataclassArray.from_storage(type(arr.type)(storage_rev.type, DummyData), storage_rev)
+
+        assert arr_rev.keys() == keys
+        assert arr_rev.to_pylist() == items
+
+    def test__dataclass_array__iter_items__reuse_item(self) -> None:
+        items = [
+            DummyData(DummyIntEnum.Invalid, None, None, "name0"),
+            None,
+            DummyData(DummyIntEnum.Valid, None, 3.0, "name2"),
+        ]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        it = arr.iter_items(reuse_item=True)
+
+        item0 = next(it)
+        assert item0 == items[0]
+        assert next(it) is None
+        item2 = next(it)
+        assert item2 is item0
+        assert item2 == items[2]
+
+    def test__dataclass_array__iter_views__proper_result(self) -> None:
+        items = [
+            DummyData(DummyIntEnum.Invalid, None, None, "name0"),
+            None,
+            DummyData(DummyIntEnum.Valid, None, 3.0, "name2"),
+        ]
+        arr = DataclassArray.from_iterator(items, registry=self.registry)
+        views = list(arr.iter_views())
+
+        assert len(views) == 3
+        assert views[1] is None
+        assert type(views[0]).__name__ == "DummyDataView"
+        assert views[0] == (DummyIntEnum.Invalid, None, None, "name0")
+        assert views[2].name == "name2"  # type:ignore
+        assert views[2].score == 3.0  # type:ignore
+
     def test__dataclass_array__keys__proper_list(self) -> None:
         items = [
             None,
@@ -54,6 +179,9 @@ class TestDataclassArray(unittest.TestCase):
         ]
         arr = DataclassArray.from_iterator(items, registry=self.registry)
         assert arr.keys() == ["type", "data", "score", "name"]
+        # Cached field mapping: not shared with the caller.
+        arr.keys().append("other")
+        assert arr.keys() == ["type", "data", "score", "name"]
 
     def test__dataclass_array__getattr__proper_columns(self) -> None:
         items = [
@@ -67,3 +195,6 @@ class TestDataclassArray(unittest.TestCase):
         assert isinstance(arr.data, TensorArray)
         assert isinstance(arr.score, pa.FloatingPointArray)
         assert isinstance(arr.name, pa.StringArray)
+        with self.assertRaises(AttributeError):
+            arr.unknown
+        assert not hasattr(arr, "__wrapped__")
@@ -1,4 +1,3 @@
-import copy
 import dataclasses
 import unittest
 from enum import IntEnum
@@ -9,9 +8,13 @@ import numpy.testing as npt
 import pyarrow as pa
 
 from arrowbic.core.base_types import NdArrayGeneric
-from arrowbic.core.extension_type_registry import _global_registry
+from arrowbic.core.extension_type_registry import ExtensionTypeRegistry, _global_registry
 from arrowbic.extensions import DataclassArray, DataclassType
-from arrowbic.extensions.dataclass_type import _from_arrow_field_to_dataclass_field
+from arrowbic.extensions.dataclass_type import (
+    _from_arrow_field_to_dataclass_field,
+    _get_dataclass_fields,
+    _make_field_array,
+)
 
 
 class DummyIntEnum(IntEnum):
@@ -28,16 +31,25 @@ class DummyData:
 
 
 class TestSimpleDataclassType(unittest.TestCase):
+    base_registry: ExtensionTypeRegistry
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Start from the default global registry, registering the test classes once.
+        cls.base_registry = _global_registry.clone()
+        cls.base_registry.register_item_pyclass(DummyIntEnum)
+        cls.base_registry.register_item_pyclass(DummyData)
+
     def setUp(self) -> None:
-        # Start from the default global registry.
-        self.registry = copy.deepcopy(_global_registry)
-        self.registry.register_item_pyclass(DummyIntEnum)
-        self.registry.register_item_pyclass(DummyData)
+        # Cheap per-test copy: tests are free to modify their registry.
+        self.registry = self.base_registry.clone()
 
     def test__dataclass_type__root_extension_type__proper_properties(self) -> None:
         root_ext_type = DataclassType()
         assert root_ext_type.extension_name == "arrowbic.core.dataclass"
         assert root_ext_type.storage_type == pa.null()
+        # Slots only, no instance dictionary.
+        assert not hasattr(root_ext_type, "__dict__")
 
     def test__dataclass_type__init__not_a_proper_storage_type(self) -> None:
         with self.assertRaises(TypeError):
@@ -92,6 +104,8 @@ class TestSimpleDataclassType(unittest.TestCase):
         assert fields[1].type == np.ndarray
         assert fields[2].type == float
         assert fields[3].type == str
+        # Same dataclass definition re-used for the same schema.
+        assert DataclassType.__arrowbic_make_item_pyclass__(storage_type, ext_metadata) is item_pyclass
 
     def test__dataclass_type__from_arrow_field_to_dataclass_field__base_type(self) -> None:
         name, pyclass, dc_field = _from_arrow_field_to_dataclass_field(pa.field("field", pa.int32(), nullable=True))
@@ -107,6 +121,24 @@ class TestSimpleDataclassType(unittest.TestCase):
         assert pyclass is DummyIntEnum
         assert isinstance(dc_field, dataclasses.Field)
 
+    def test__dataclass_type__make_field_array__base_type_annotations(self) -> None:
+        assert _make_field_array([2.0, 1], float).type == pa.float64()
+        assert _make_field_array(["a", None], str).type == pa.string()
+        assert _make_field_array([None, b"a"], Optional[bytes]).type == pa.binary()
+        # Values not matching the annotation: same types as the generic conversion.
+        assert _make_field_array([None, None], Optional[float]).type == pa.null()
+        assert _make_field_array([1, 2], float).type == pa.int64()
+        assert _make_field_array([np.float32(1), np.float32(2)], float).type == pa.float32()
+        assert _make_field_array(["a", "b"], bytes).type == pa.string()
+        assert _make_field_array([b"a", b"b"], float).type == pa.binary()
+        assert _make_field_array([1, 2], int).type == pa.int64()
+
+    def test__dataclass_type__get_dataclass_fields__cached(self) -> None:
+        field_names, field_types = _get_dataclass_fields(DummyData)
+        assert field_names == ("type", "data", "score", "name")
+        assert field_types == (DummyIntEnum, Optional[NdArrayGeneric], Optional[float], str)
+        assert _get_dataclass_fields(DummyData)[0] is field_names
+
     def test__dataclass_type__from_iterator__none_only(self) -> None:
         values = [None, None, None, None]
         arr: pa.NullArray = DataclassType.__arrowbic_from_item_iterator__(iter(values), size=3, registry=self.registry)
@@ -128,14 +160,26 @@ class TestSimpleDataclassType(unittest.TestCase):
 
         assert arr.null_count == 0
         assert arr.storage.field(0).to_pylist() == [DummyIntEnum.Invalid, DummyIntEnum.Valid]
-        assert arr.storage.field(2).to_pylist() == [1.0, 2.0]
-        assert arr.storage.field(3).to_pylist() == ["name0", "name1"]
+        # Arrow-native comparisons of base type fields.
+        assert arr.storage.field(2).equals(pa.array([1.0, 2.0], type=pa.float64()))
+        assert arr.storage.field(3).equals(pa.array(["name0", "name1"], type=pa.string()))
 
         arrays = arr.storage.field(1).to_pylist()
         assert len(arrays) == 2
         npt.assert_array_equal(arrays[0], [1, 2, 3])  # type:ignore
         npt.assert_array_equal(arrays[1], [4, 5, 6])  # type:ignore
 
+        # Equivalent struct-of-arrays construction.
+        columns = {
+            "type": arr.storage.field(0),
+            "data": arr.storage.field(1),
+            "score": np.array([1.0, 2.0]),
+            "name": ["name0", "name1"],
+        }
+        soa_arr = DataclassArray.from_field_arrays(DummyData, columns, registry=self.registry)
+        assert soa_arr.type is arr.type
+        assert soa_arr.storage.equals(arr.storage)
+
     def test__dataclass_type__from_iterator__common_items__with_none(self) -> None:
         items = [
             None,
@@ -151,10 +195,15 @@ class TestSimpleDataclassType(unittest.TestCase):
         assert arr[0] is None
         assert arr[3] is None
 
-        arrays = arr.storage.field(1).to_pylist()
-        print(arrays)
         # Proper null count on field arrays.
         assert arr.storage.field(0).null_count == 2
         assert arr.storage.field(1).null_count == 4
         assert arr.storage.field(2).null_count == 3
         assert arr.storage.field(3).null_count == 2
+
+        # Same storage when built directly from the field columns and the null mask.
+        columns = {name: arr.storage.field(name) for name in arr.keys()}
+        mask = [v is None for v in items]
+        soa_arr = DataclassArray.from_field_arrays(DummyData, columns, mask=mask, registry=self.registry)
+        assert soa_arr.type is arr.type
+        assert soa_arr.storage.equals(arr.storage)
@@ -1,9 +1,11 @@
-import copy
 import unittest
 from enum import IntEnum
 
-from arrowbic.core.extension_type_registry import _global_registry
+import pyarrow as pa
+
+from arrowbic.core.extension_type_registry import ExtensionTypeRegistry, _global_registry
 from arrowbic.extensions import IntEnumArray
+from arrowbic.extensions.int_enum_array import _make_int_enum_lookup_table
 
 
 class DummyIntEnum(IntEnum):
@@ -12,9 +14,17 @@ class DummyIntEnum(IntEnum):
 
 
 class TestIntEnumArray(unittest.TestCase):
+    base_registry: ExtensionTypeRegistry
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Start from the default global registry, registering the test classes once.
+        cls.base_registry = _global_registry.clone()
+        cls.base_registry.register_item_pyclass(DummyIntEnum)
+
     def setUp(self) -> None:
-        self.registry = copy.deepcopy(_global_registry)
-        self.registry.register_item_pyclass(DummyIntEnum)
+        # Cheap per-test copy: tests are free to modify their registry.
+        self.registry = self.base_registry.clone()
 
     def test__int_enum_array__get_item__int_index__proper_result(self) -> None:
         values = [None, DummyIntEnum.Invalid, DummyIntEnum.Valid, None, None]
@@ -35,3 +45,18 @@ class TestIntEnumArray(unittest.TestCase):
         arr = IntEnumArray.from_iterator(values_in, registry=self.registry)
         values_out = arr.to_pylist()
         assert values_out == values_in
+
+    def test__int_enum_array__to_pylist__invalid_raw_value(self) -> None:
+        ext_type = self.registry.find_extension_type(DummyIntEnum, pa.int64())
+        arr = IntEnumArray.from_storage(ext_type, pa.array([1, None, 3]))
+        assert arr[0] is DummyIntEnum.Invalid
+        with self.assertRaises(ValueError):
+            arr[2]
+        with self.assertRaises(ValueError):
+            arr.to_pylist()
+
+    def test__int_enum_array__make_int_enum_lookup_table__proper_table(self) -> None:
+        value_min, members, is_valid_index = _make_int_enum_lookup_table(DummyIntEnum)  # type:ignore
+        assert value_min == 1
+        assert members.tolist() == [DummyIntEnum.Invalid, DummyIntEnum.Valid, None]
+        assert is_valid_index.tolist() == [True, True, False]
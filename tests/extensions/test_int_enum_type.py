@@ -1,11 +1,11 @@
-import copy
 import unittest
 from enum import Enum, IntEnum
 
 import pyarrow as pa
 
-from arrowbic.core.extension_type_registry import _global_registry
+from arrowbic.core.extension_type_registry import ExtensionTypeRegistry, _global_registry
 from arrowbic.extensions import IntEnumArray, IntEnumType
+from arrowbic.extensions.int_enum_type import _get_int_enum_storage_type
 
 
 class DummyIntEnum(IntEnum):
@@ -14,19 +14,30 @@ class DummyIntEnum(IntEnum):
 
 
 class TestIntEnumType(unittest.TestCase):
+    base_registry: ExtensionTypeRegistry
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Start from the default global registry, registering the test classes once.
+        cls.base_registry = _global_registry.clone()
+        cls.base_registry.register_item_pyclass(DummyIntEnum)
+
     def setUp(self) -> None:
-        # Start from the default global registry.
-        self.registry = copy.deepcopy(_global_registry)
-        self.registry.register_item_pyclass(DummyIntEnum)
+        # Cheap per-test copy: tests are free to modify their registry.
+        self.registry = self.base_registry.clone()
 
     def test__int_enum_type__init__root_extension_type(self) -> None:
         ext_type = IntEnumType()
         assert ext_type.extension_name == "arrowbic.core.int_enum"
         assert ext_type.item_pyclass_name is None
+        # Slots only, no instance dictionary.
+        assert not hasattr(ext_type, "__dict__")
 
     def test__int_enum_type__init__storage_type_check(self) -> None:
         with self.assertRaises(TypeError):
-            IntEnumType(pa.int32(), DummyIntEnum)
+            IntEnumType(pa.float32(), DummyIntEnum)
+        # Any integer storage is valid.
+        assert IntEnumType(pa.int32(), DummyIntEnum).storage_type == pa.int32()
 
     def test__int_enum_type__init__check_item_pyclass_is_int_enum(self) -> None:
         class DummyEnum(Enum):
@@ -70,7 +81,10 @@ class TestIntEnumType(unittest.TestCase):
 
         assert isinstance(arr, IntEnumArray)
         assert isinstance(arr.type, IntEnumType)
+        assert arr.type.storage_type == pa.int8()
         assert len(arr) == len(values)
+        # Arrow-native comparison of the raw storage (no Python items).
+        assert arr.storage.equals(pa.array([None, 1, 2, None], type=pa.int8()))
         assert list(arr) == values
 
     def test__int_enum_type__arrowbic_from_item_iterator__input_iterator(self) -> None:
@@ -81,3 +95,16 @@ class TestIntEnumType(unittest.TestCase):
         assert isinstance(arr.type, IntEnumType)
         assert len(arr) == len(values) - 1
         assert list(arr) == values[:-1]
+
+    def test__int_enum_type__arrowbic_from_item_iterator__none_only(self) -> None:
+        arr: pa.NullArray = IntEnumType.__arrowbic_from_item_iterator__([None, None], registry=self.registry)
+        assert isinstance(arr, pa.NullArray)
+        assert len(arr) == 2
+
+    def test__int_enum_type__get_int_enum_storage_type__smallest_type(self) -> None:
+        class DummyIntEnumLarge(IntEnum):
+            Small = -1
+            Large = 40000
+
+        assert _get_int_enum_storage_type(DummyIntEnum) == pa.int8()
+        assert _get_int_enum_storage_type(DummyIntEnumLarge) == pa.int32()
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+import numpy.testing as npt
 import pyarrow as pa
 
 from arrowbic.extensions import TensorArray
@@ -26,21 +27,69 @@ class TestTensorArray(unittest.TestCase):
         assert arr[3].shape == (3, 2)
         assert arr[3].tolist() == values[3]
 
+    def test__tensor_array__get_item__negative_index_and_bool_data(self) -> None:
+        values = [None, [True, False], None, [[False], [True]]]
+        arr = TensorArray.from_iterator(values)
+
+        last_item, first_item = arr[-1], arr[-3]
+        assert last_item is not None and first_item is not None
+        assert last_item.tolist() == values[3]
+        assert first_item.tolist() == values[1]
+        assert arr[-2] is None
+
+    def test__tensor_array__get_item__out_of_bounds_index(self) -> None:
+        arrays = [TensorArray.from_tensor(np.arange(12).reshape(3, 2, 2)), TensorArray.from_iterator([None, [1], [2]])]
+        for arr in arrays:
+            with self.subTest(null_count=arr.null_count):
+                for index in [3, 4, -4, -5]:
+                    with self.assertRaises(IndexError):
+                        arr[index]
+
+    def test__tensor_array__to_pylist__proper_result(self) -> None:
+        values = [None, [1, 2, 3], None, [[4.0, 5.0], [6.0, 7.0]]]
+        arr = TensorArray.from_iterator(values)
+        values_out = arr.to_pylist()
+
+        assert [v if v is None else v.tolist() for v in values_out] == values
+        assert [v if v is None else v.tolist() for v in arr[1:].to_pylist()] == values[1:]
+        assert TensorArray.from_iterator([None, None]).to_pylist() == [None, None]
+
     def test__tensor_array__from_tensor__proper_result(self) -> None:
-        values = np.random.rand(3, 4, 5).astype(np.float32)
+        for dtype, awtype in [(np.float16, pa.float16()), (np.float32, pa.float32()), (np.float64, pa.float64())]:
+            with self.subTest(dtype=dtype):
+                values = np.arange(60, dtype=dtype).reshape(3, 4, 5)
+                arr = TensorArray.from_tensor(values)
+
+                assert isinstance(arr, TensorArray)
+                assert len(arr) == 3
+                assert arr.null_count == 0
+
+                assert arr.type.storage_type[0].type == pa.list_(awtype, -1)
+                assert arr.type.storage_type[1].type == pa.list_(pa.int64(), -1)
+                # Proper data & shape.
+                data_arr = arr.storage.field(0)
+                npt.assert_array_equal(data_arr.offsets.to_numpy(), [0, 20, 40, 60])
+                npt.assert_array_equal(data_arr.values.to_numpy().reshape(values.shape), values)
+                assert arr.storage.field(1)[1].as_py() == [4, 5]
+                # Zero-copy data values.
+                assert arr.storage.field(0).values.buffers()[1].address == values.ctypes.data
+                # Items round trip, with the same dtype.
+                item = arr[1]
+                assert isinstance(item, np.ndarray)
+                assert item.dtype == dtype
+                npt.assert_array_equal(item, values[1])
+
+    def test__tensor_array__from_tensor__empty_items(self) -> None:
+        values = np.zeros((3, 0, 2), dtype=np.float32)
         arr = TensorArray.from_tensor(values)
 
-        assert isinstance(arr, TensorArray)
         assert len(arr) == 3
-        assert arr.null_count == 0
-
-        assert arr.type.storage_type[0].type == pa.list_(pa.float32(), -1)
-        assert arr.type.storage_type[1].type == pa.list_(pa.int64(), -1)
-        # Proper data & shape.
-        assert arr.storage.field(0)[1].as_py() == np.ravel(values[1]).tolist()
-        assert arr.storage.field(1)[1].as_py() == [4, 5]
+        item = arr[2]
+        assert isinstance(item, np.ndarray)
+        assert item.shape == (0, 2)
+        assert arr.storage.field(1).to_pylist() == [[0, 2]] * 3
 
     def test__tensor_array__from_tensor__not_enough_dimensions(self) -> None:
-        values = np.random.rand(3).astype(np.float32)
+        values = np.arange(3, dtype=np.float32)
         with self.assertRaises(ValueError):
             TensorArray.from_tensor(values)
@@ -1,4 +1,3 @@
-import copy
 import unittest
 
 import numpy as np
@@ -10,12 +9,14 @@ from arrowbic.extensions import TensorArray, TensorType
 
 class TestTensorType(unittest.TestCase):
     def setUp(self) -> None:
-        self.registry = copy.deepcopy(_global_registry)
+        self.registry = _global_registry.clone()
 
     def test__tensor_type__default_init__proper_type(self) -> None:
         ext_type = TensorType()
         assert ext_type.storage_type == pa.null()
         assert ext_type.extension_name == "arrowbic.core.tensor"
+        # Slots only, no instance dictionary.
+        assert not hasattr(ext_type, "__dict__")
 
     def test__tensor_type__init__invalid_storage_type(self) -> None:
         with self.assertRaises(TypeError):
@@ -63,7 +64,7 @@ class TestTensorType(unittest.TestCase):
         assert arr.storage.field(1)[3].as_py() == [2, 2]
 
     def test__tensor_type__arrowbic_from_iterator__ndarray_input__proper_result(self) -> None:
-        values = np.random.rand(3, 4, 5).astype(np.float32)
+        values = np.arange(60, dtype=np.float32).reshape(3, 4, 5)
         arr = TensorType.__arrowbic_from_item_iterator__(values, registry=self.registry)
 
         assert isinstance(arr, TensorArray)
@@ -73,3 +74,32 @@ class TestTensorType(unittest.TestCase):
         # Proper data & shape.
         assert arr.storage.field(0)[1].as_py() == np.ravel(values[1]).tolist()
         assert arr.storage.field(1)[1].as_py() == [4, 5]
+
+    def test__tensor_type__arrowbic_from_iterator__none_only_and_empty_items(self) -> None:
+        arr = TensorType.__arrowbic_from_item_iterator__([None, None], registry=self.registry)
+        assert len(arr) == 2
+        assert arr.null_count == 2
+
+        arr = TensorType.__arrowbic_from_item_iterator__([np.zeros((0, 2)), None, [1.0]], registry=self.registry)
+        assert arr.storage.field(0).to_pylist() == [[], None, [1.0]]
+        item = arr[0]
+        assert isinstance(item, np.ndarray)
+        assert item.shape == (0, 2)
+
+    def test__tensor_type__arrowbic_from_iterator__sequence_with_size(self) -> None:
+        values = [np.zeros((2,)), None, np.ones((1,))]
+        arr = TensorType.__arrowbic_from_item_iterator__(values, size=2, registry=self.registry)
+        assert len(arr) == 2
+        assert arr.storage.field(0).to_pylist() == [[0.0, 0.0], None]
+        arr = TensorType.__arrowbic_from_item_iterator__(values, size=5, registry=self.registry)
+        assert len(arr) == 3
+
+    def test__tensor_type__arrowbic_from_iterator__mixed_dtypes(self) -> None:
+        # Incompatible dtypes: no silent conversion of the data to strings.
+        with self.assertRaises(pa.ArrowInvalid):
+            TensorType.__arrowbic_from_item_iterator__([np.array([1, 2]), np.array(["a"])], registry=self.registry)
+        # Compatible dtypes: same as PyArrow conversion.
+        values = [np.array([1, 2], dtype=np.int32), np.array([1.5])]
+        arr = TensorType.__arrowbic_from_item_iterator__(values, registry=self.registry)
+        assert arr.storage.field(0).type == pa.list_(pa.float64())
+        assert arr.storage.field(0).to_pylist() == [[1.0, 2.0], [1.5]]